@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+"""
+facebooklib.aio
+~~~~~~~~~~~~~~~
+
+Asyncio counterpart of `fblib.core` built on aiohttp. All wrapper methods
+mirror the synchronous API but are coroutines, so independent Graph calls
+can be overlapped on one event loop:
+
+    async with AsyncUserAPI(access_token) as api:
+        users = await asyncio.gather(*[api.get_objects(i) for i in ids])
+
+Requires the `aiohttp` package (`pip install fblib[async]`).
+"""
+import aiohttp
+
+from fblib.core import FacebookError
+
+
+class AsyncGraphAPI:
+    """ Facebook Graph API over aiohttp """
+    api_url = 'https://graph.facebook.com'
+
+    def __init__(self):
+        self._session = None
+
+    @property
+    def session(self):
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=100)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def _call(self, http_method, path, **params):
+        """ Basic method for calling Facebook Graph Api
+            Required parameters:
+                http_method -- HTTP request methods, e.g. 'POST', 'GET', etc.
+                path -- part of URL after `self.api_url`
+            Optional parameters:
+                kwargs -- dictionary that specifying additional data to send
+                          to the server
+        """
+        url = '{}/{}'.format(self.api_url, path)
+        async with self.session.request(http_method, url,
+                                        params=params) as res:
+            json_data = await res.json()
+        if 'error' in json_data:
+            raise FacebookError(json_data)
+        return json_data
+
+    async def close(self):
+        """ Release the connections held by the aiohttp session.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+
+class AsyncAppAPI(AsyncGraphAPI):
+    """ Apps methods for Facebook Graph API, asyncio edition.
+    Example:
+        app_api = AsyncAppAPI(app_id='19619262701',
+                              app_secret='5afa235c1ea2c6a7df')
+        app_access_token = await app_api.get_app_access_token()
+        analytics = await app_api.analytics()
+    """
+
+    def __init__(self, app_id, app_secret):
+        super().__init__()
+        self.app_id = app_id
+        self.app_secret = app_secret
+        self.access_token = None
+
+    async def _get_access_token(self):
+        """ Returns the current application access token being used by the SDK
+        """
+        params = dict(client_id=self.app_id,
+                      client_secret=self.app_secret,
+                      grant_type='client_credentials')
+        json_data = await self._call('GET', 'oauth/access_token', **params)
+        self.access_token = json_data.get('access_token')
+        return self.access_token
+
+    async def call(self, http_method, api_method, **kwargs):
+        """ Basic method for calling Facebook Graph Api
+            Required parameters:
+                http_method -- HTTP request methods, e.g. 'POST', 'GET', etc.
+                api_method -- part of URL after `self.api_url`
+            Optional parameters:
+                kwargs -- dictionary that specifying additional data to send
+                          to the server
+        """
+        if not self.access_token:
+            await self._get_access_token()
+        path = '/'.join((self.app_id, api_method))
+        params = dict(access_token=self.access_token)
+        params.update(kwargs)
+        return await self._call(http_method, path, **params)
+
+    async def get_app_access_token(self):
+        """ Returns the current access token being used by the SDK.
+        """
+        return self.access_token or await self._get_access_token()
+
+    async def analytics(self, metric=None, **kwargs):
+        """ Returns detailed analytics about the demographics of your users and
+            how users are sharing from your application.
+            Optional parameters:
+                metric -- filter analytics information by this metric
+                kwargs -- dictionary with additional parameters for the request
+        """
+        api_method = 'insights'
+        if metric:
+            api_method = '/'.join((api_method, metric))
+        return await self.call('GET', api_method, **kwargs)
+
+
+class AsyncUserAPI(AsyncGraphAPI):
+    """ Users methods for Facebook Graph API, asyncio edition.
+    """
+
+    def __init__(self, access_token):
+        super().__init__()
+        self.access_token = access_token
+
+    async def call(self, http_method, api_method, **kwargs):
+        """ Basic method for calling Facebook Graph Api
+            Required parameters:
+                http_method -- HTTP request methods, e.g. 'POST', 'GET', etc.
+                api_method -- part of URL after `self.api_url`
+            Optional parameters:
+                kwargs -- dictionary that specifying additional data to send
+                          to the server
+        """
+        params = dict(access_token=self.access_token)
+        params.update(kwargs)
+        return await self._call(http_method, api_method, **params)
+
+    async def get_objects(self, object_id, **kwargs):
+        """ Returns object from Facebook Graph API
+
+            Required parameters:
+                object_id -- ID of object in the social graph, e.g: 'me',
+                             '0xKirill', '0xKirill/picture', '817129783203'
+            Optional parameters:
+                kwargs -- dictionary with additional parameters for the request
+        """
+        return await self.call('GET', '{}'.format(object_id), **kwargs)
+
+    async def get_connections(self, object_id, connection, **kwargs):
+        """ Returns connections between objects
+
+            Required parameters:
+                object_id -- ID of object in the social graph, e.g., 'me',
+                            '0xKirill', '0xKirill/picture', '817129783203'
+                connection -- type of connection, e.g., 'friends', 'home',
+                            'likes', 'movies', 'music', 'permissions', etc.
+            Optional parameters:
+                kwargs -- dictionary with additional parameters for the request
+        """
+        api_method = '{}/{}'.format(object_id, connection)
+        return await self.call('GET', api_method, **kwargs)
+
+    async def publish(self, object_id, connection, **kwargs):
+        """ Publish to the Facebook graph
+            Required parameters:
+                object_id -- ID of object in the social graph, e.g., 'me',
+                            '0xKirill', '0xKirill/picture', '817129783203'
+                connection -- type of connection, e.g., 'feed', 'comments',
+                            'likes', 'notes', 'links', 'events', etc.
+            Optional parameters:
+                kwargs -- dictionary with additional parameters for the request
+        """
+        api_method = '{}/{}'.format(object_id, connection)
+        return await self.call('POST', api_method, **kwargs)
+
+    async def delete(self, object_id):
+        """ Delete objects in the graph
+            Required parameters:
+                object_id -- ID of object in the social graph, e.g., 'me',
+                            '0xKirill', '0xKirill/picture', '817129783203'
+        """
+        return await self.call('DELETE', '{}'.format(object_id))
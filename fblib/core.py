@@ -6,10 +6,43 @@ facebooklib.core
 This module contains methods for direct interaction with Facebook Graph API.
 TODO: batch requests and cookies
 """
+import concurrent.futures
+import hashlib
+import json
+import os
+import time
+from urllib.parse import quote, urlencode
+
 import requests
 
+try:  # optional speedup: orjson parses ~5x faster than stdlib json
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+try:  # optional: httpx enables HTTP/2 stream multiplexing
+    import httpx
+except ImportError:
+    httpx = None
+
+#: Facebook processes at most 50 sub-requests per batch call
+BATCH_LIMIT = 50
+
+#: where app access tokens are cached between processes
+TOKEN_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'fblib')
+
+
+def _encode_token(access_token):
+    """ URL-encode the access token once so calls without extra parameters
+        can skip the per-request urlencode pass entirely.
+    """
+    if not access_token:
+        return None
+    return 'access_token=' + quote(access_token, safe='')
+
 
 class FacebookError(Exception):
+    __slots__ = ('value', 'message')
 
     def __init__(self, value):
         self.value = value
@@ -19,27 +52,97 @@ class FacebookError(Exception):
         return repr(self.message)
 
 
+def _make_session():
+    """ Build a `requests.Session` with a sized HTTPS connection pool.
+        Reusing the session keeps connections alive between calls, so
+        only the first request to graph.facebook.com pays the TCP + TLS
+        handshake.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=10,
+                                            pool_maxsize=20)
+    session.mount('https://', adapter)
+    return session
+
+
 class GraphAPI:
     """ Facebook Graph API """
     api_url = 'https://graph.facebook.com'
     api_verion = 'v3.0'
+    _url_prefix = api_url + '/'
+    session = _make_session()
+    __slots__ = ('_client',)
 
-    def _call(self, http_method, path, **params):
+    def _enable_http2(self):
+        """ Switch this instance to an HTTP/2 client so concurrent calls
+            are multiplexed over a single TLS connection instead of
+            serializing on HTTP/1.1 sockets.
+        """
+        if httpx is None:
+            raise RuntimeError('HTTP/2 support requires the httpx package '
+                               '(pip install fblib[http2])')
+        self._client = httpx.Client(http2=True,
+                                    limits=httpx.Limits(max_connections=20))
+
+    def _call(self, http_method, path, parse=True, **params):
         """ Basic method for calling Facebook Graph Api
             Required parameters:
                 http_method -- HTTP request methods, e.g. 'POST', 'GET', etc.
                 path -- part of URL after `self.api_url`
             Optional parameters:
+                parse -- when False, skip decoding the response body and only
+                         check the HTTP status; useful for write calls whose
+                         '{\"success\": true}' result is discarded anyway
                 kwargs -- dictionary that specifying additional data to send
                           to the server
         """
-        url = '{}/{}'.format(self.api_url, path)
-        res = requests.request(http_method, url, params=params)
-        json_data = res.json()
+        url = self._url_prefix + path
+        return self._request(http_method, url, params, parse)
+
+    def _request(self, http_method, url, params, parse=True, data=None):
+        """ Issue the HTTP request and postprocess the Graph response.
+            `data` is sent as the form-encoded request body; large
+            payloads (batch operations) must travel there, not in the
+            query string.
+        """
+        client = getattr(self, '_client', None)
+        res = (client or self.session).request(http_method, url,
+                                               params=params, data=data)
+        if not parse:
+            if res.status_code >= 400:
+                raise FacebookError({'error': {
+                    'code': res.status_code,
+                    'message': getattr(res, 'reason', None)}})
+            return None
+        json_data = _loads(res.content)
         if 'error' in json_data:
             raise FacebookError(json_data)
         return json_data
 
+    def close(self):
+        """ Release per-instance transport state (the HTTP/2 client,
+            when enabled). The pooled session is class-level and shared
+            by every API instance, so it is deliberately left alone here;
+            use `close_session()` at process shutdown to tear it down.
+        """
+        client = getattr(self, '_client', None)
+        if client is not None:
+            client.close()
+
+    @classmethod
+    def close_session(cls):
+        """ Close the shared connection pool. Only call when no API
+            instance will issue further requests, e.g. at process
+            shutdown.
+        """
+        cls.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
 
 class AppAPI(GraphAPI):
     """ Apps methods for Facebook Graph API
@@ -49,11 +152,63 @@ class AppAPI(GraphAPI):
         app_access_token = app_api.get_app_access_token()
         analytics = app_api.analytics()
     """
+    __slots__ = ('app_id', 'app_secret', 'token_cache', '_app_prefix',
+                 'access_token', '_token_qs')
 
-    def __init__(self, app_id, app_secret):
+    def __init__(self, app_id, app_secret, token_cache=TOKEN_CACHE_DIR,
+                 use_http2=False):
         self.app_id = app_id
         self.app_secret = app_secret
-        self.access_token = None
+        self.token_cache = token_cache
+        self._app_prefix = app_id + '/'
+        self.access_token = self._read_cached_token()
+        self._token_qs = _encode_token(self.access_token)
+        if use_http2:
+            self._enable_http2()
+
+    def _token_cache_path(self):
+        key = hashlib.sha256(
+            (self.app_id + self.app_secret).encode()).hexdigest()
+        return os.path.join(self.token_cache, '{}.json'.format(key))
+
+    def _read_cached_token(self):
+        """ Returns the cached app access token, or None if the cache is
+            disabled, missing, or expired.
+        """
+        if not self.token_cache:
+            return None
+        try:
+            with open(self._token_cache_path()) as cache_file:
+                cached = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+        expires_at = cached.get('expires_at')
+        if expires_at and expires_at < time.time():
+            return None
+        return cached.get('access_token')
+
+    def _write_cached_token(self, token, expires_in=None):
+        """ Atomically persist the token so other processes skip the
+            `oauth/access_token` round-trip. Cache failures are ignored.
+        """
+        if not self.token_cache:
+            return
+        cached = {'access_token': token}
+        if expires_in:
+            cached['expires_at'] = time.time() + float(expires_in)
+        path = self._token_cache_path()
+        try:
+            # the token is a credential: keep the cache dir and file
+            # readable by the owner only
+            os.makedirs(self.token_cache, mode=0o700, exist_ok=True)
+            tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+            fd = os.open(tmp_path,
+                         os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as cache_file:
+                json.dump(cached, cache_file)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
 
     def _get_access_token(self):
         """ Returns the current application access token being used by the SDK
@@ -63,27 +218,39 @@ class AppAPI(GraphAPI):
                       grant_type='client_credentials')
         json_data = self._call('GET', 'oauth/access_token', **params)
         self.access_token = json_data.get('access_token')
+        self._token_qs = _encode_token(self.access_token)
+        self._write_cached_token(self.access_token,
+                                 json_data.get('expires_in'))
         return self.access_token
 
-    def call(self, http_method, api_method, **kwargs):
+    def call(self, http_method, api_method, parse=True, **kwargs):
         """ Basic method for calling Facebook Graph Api
             Required parameters:
                 http_method -- HTTP request methods, e.g. 'POST', 'GET', etc.
                 api_method -- part of URL after `self.api_url`
             Optional parameters:
+                parse -- when False, skip decoding the response body
                 kwargs -- dictionary that specifying additional data to send
                           to the server
         """
         if not self.access_token:
             self._get_access_token()
-        path = '/'.join((self.app_id, api_method))
-        params = dict(access_token=self.access_token)
-        params.update(kwargs)
-        return self._call(http_method, path, **params)
+        path = self._app_prefix + api_method
+        if not kwargs and self._token_qs:
+            url = self._url_prefix + path + '?' + self._token_qs
+            return self._request(http_method, url, None, parse)
+        params = kwargs
+        params['access_token'] = self.access_token
+        return self._call(http_method, path, parse=parse, **params)
 
-    def get_app_access_token(self):
+    def get_app_access_token(self, force_refresh=False):
         """ Returns the current access token being used by the SDK.
+            Optional parameters:
+                force_refresh -- fetch a fresh token even if one is cached,
+                    e.g. after a 'session has been invalidated' error
         """
+        if force_refresh:
+            return self._get_access_token()
         return self.access_token or self._get_access_token()
 
     def analytics(self, metric=None, **kwargs):
@@ -95,7 +262,7 @@ class AppAPI(GraphAPI):
         """
         api_method = 'insights'
         if metric:
-            api_method = '/'.join((api_method, metric))
+            api_method = f'insights/{metric}'
         return self.call('GET', api_method, **kwargs)
 
     def get_list_of_test_users(self, **kwargs):
@@ -137,27 +304,122 @@ class AppAPI(GraphAPI):
         return self.call('GET', api_method, **kwargs)
 
 
+class BatchFuture:
+    """ Placeholder for the result of a call queued with `UserAPI.batching`.
+        The value becomes available once the batch is flushed.
+    """
+    _unresolved = object()
+
+    def __init__(self):
+        self._value = self._unresolved
+
+    def _resolve(self, value):
+        self._value = value
+
+    def result(self):
+        """ Returns the parsed sub-request response.
+            Raises FacebookError if the sub-request failed, RuntimeError if
+            the batch has not been executed yet.
+        """
+        if self._value is self._unresolved:
+            raise RuntimeError('batch has not been executed yet')
+        if isinstance(self._value, dict) and 'error' in self._value:
+            raise FacebookError(self._value)
+        return self._value
+
+
+class BatchQueue:
+    """ Collects Graph API calls and flushes them as batch requests.
+        Returned by `UserAPI.batching`; each queueing method hands back a
+        `BatchFuture` resolved when the batch is sent.
+    """
+
+    def __init__(self, api):
+        self.api = api
+        self.queue = []
+
+    def _enqueue(self, http_method, relative_url, **kwargs):
+        operation = {'method': http_method, 'relative_url': relative_url}
+        if kwargs:
+            encoded = urlencode(kwargs)
+            if http_method == 'POST':
+                operation['body'] = encoded
+            else:
+                operation['relative_url'] = '{}?{}'.format(relative_url,
+                                                           encoded)
+        future = BatchFuture()
+        self.queue.append((operation, future))
+        return future
+
+    def get_objects(self, object_id, **kwargs):
+        """ Queue a `UserAPI.get_objects` call; returns a BatchFuture.
+        """
+        return self._enqueue('GET', str(object_id), **kwargs)
+
+    def get_connections(self, object_id, connection, **kwargs):
+        """ Queue a `UserAPI.get_connections` call; returns a BatchFuture.
+        """
+        return self._enqueue('GET', object_id + '/' + connection, **kwargs)
+
+    def publish(self, object_id, connection, **kwargs):
+        """ Queue a `UserAPI.publish` call; returns a BatchFuture.
+        """
+        return self._enqueue('POST', object_id + '/' + connection,
+                             **kwargs)
+
+    def delete(self, object_id):
+        """ Queue a `UserAPI.delete` call; returns a BatchFuture.
+        """
+        return self._enqueue('DELETE', str(object_id))
+
+    def execute(self):
+        """ Flush all queued calls, resolving their futures.
+        """
+        if not self.queue:
+            return
+        operations = [operation for operation, _ in self.queue]
+        responses = self.api.batch(operations)
+        for (_, future), response in zip(self.queue, responses):
+            future._resolve(response)
+        self.queue = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.execute()
+
+
 class UserAPI(GraphAPI):
     """ Users methods for Facebook Graph API
     """
+    __slots__ = ('access_token', '_token_qs')
 
-    def __init__(self, access_token):
+    def __init__(self, access_token, use_http2=False):
         """
         """
         self.access_token = access_token
+        self._token_qs = _encode_token(access_token)
+        if use_http2:
+            self._enable_http2()
 
-    def call(self, http_method, api_method, **kwargs):
+    def call(self, http_method, api_method, parse=True, **kwargs):
         """ Basic method for calling Facebook Graph Api
             Required parameters:
                 http_method -- HTTP request methods, e.g. 'POST', 'GET', etc.
                 api_method -- part of URL after `self.api_url`
             Optional parameters:
+                parse -- when False, skip decoding the response body
                 kwargs -- dictionary that specifying additional data to send
                           to the server
         """
-        params = dict(access_token=self.access_token)
-        params.update(kwargs)
-        return self._call(http_method, api_method, **params)
+        if not kwargs and self._token_qs:
+            url = self._url_prefix + api_method + '?' + self._token_qs
+            return self._request(http_method, url, None, parse)
+        params = kwargs
+        params['access_token'] = self.access_token
+        return self._call(http_method, api_method, parse=parse, **params)
 
     def get_objects(self, object_id, **kwargs):
         """ Returns object from Facebook Graph API
@@ -168,8 +430,7 @@ class UserAPI(GraphAPI):
             Optional parameters:
                 kwargs -- dictionary with additional parameters for the request
         """
-        api_method = '{}'.format(object_id)
-        return self.call('GET', api_method, **kwargs)
+        return self.call('GET', str(object_id), **kwargs)
 
     def get_connections(self, object_id, connection, **kwargs):
         """ Returns connections between objects
@@ -182,10 +443,37 @@ class UserAPI(GraphAPI):
             Optional parameters:
                 kwargs -- dictionary with additional parameters for the request
         """
-        api_method = '{}/{}'.format(object_id, connection)
-        return self.call('GET', api_method, **kwargs)
+        return self.call('GET', object_id + '/' + connection, **kwargs)
 
-    def publish(self, object_id, connection, **kwargs):
+    def iter_connections(self, object_id, connection, **kwargs):
+        """ Iterate over all items of a connection, one page at a time
+
+            Generator alternative to `get_connections` that transparently
+            follows `paging.next` URLs, so memory stays bounded by one page
+            no matter how large the full result set is and consumers can
+            start working before the last page has arrived.
+
+            Required parameters:
+                object_id -- ID of object in the social graph, e.g., 'me',
+                            '0xKirill', '0xKirill/picture', '817129783203'
+                connection -- type of connection, e.g., 'friends', 'home',
+                            'likes', 'movies', 'music', 'permissions', etc.
+            Optional parameters:
+                kwargs -- dictionary with additional parameters for the request
+        """
+        page = self.get_connections(object_id, connection, **kwargs)
+        while True:
+            for item in page.get('data', ()):
+                yield item
+            next_url = page.get('paging', {}).get('next')
+            if not next_url:
+                return
+            # paging.next already carries the full query string; going
+            # through _request keeps the HTTP/2 client (when enabled)
+            # and the shared error handling on the paging path too
+            page = self._request('GET', next_url, None)
+
+    def publish(self, object_id, connection, parse=True, **kwargs):
         """ Publish to the Facebook graph
             Required parameters:
                 object_id -- ID of object in the social graph, e.g., 'me',
@@ -193,16 +481,87 @@ class UserAPI(GraphAPI):
                 connection -- type of connection, e.g., 'feed', 'comments',
                             'likes', 'notes', 'links', 'events', etc.
             Optional parameters:
+                parse -- when False, skip decoding the response body
                 kwargs -- dictionary with additional parameters for the request
         """
-        api_method = '{}/{}'.format(object_id, connection)
-        return self.call('POST', api_method, **kwargs)
+        return self.call('POST', object_id + '/' + connection, parse=parse,
+                         **kwargs)
 
-    def delete(self, object_id):
+    def delete(self, object_id, parse=True):
         """ Delete objects in the graph
             Required parameters:
                 object_id -- ID of object in the social graph, e.g., 'me',
                             '0xKirill', '0xKirill/picture', '817129783203'
+            Optional parameters:
+                parse -- when False, skip decoding the response body
+        """
+        return self.call('DELETE', str(object_id), parse=parse)
+
+    def map(self, fn_name, args_iterable, max_workers=16):
+        """ Run many independent API calls in parallel threads
+
+            All threads share the pooled session, so they reuse the same
+            keep-alive HTTPS connections (`requests.Session` is thread-safe
+            for independent requests). Results are yielded in input order.
+
+            Required parameters:
+                fn_name -- name of the UserAPI method to call, e.g.
+                           'get_objects'
+                args_iterable -- iterable of positional-argument tuples, one
+                           per call; bare (non-tuple) items are treated as a
+                           single argument
+            Optional parameters:
+                max_workers -- number of worker threads, 16 by default
+
+            Example:
+                for user in api.map('get_objects', ['me', '0xKirill']):
+                    print(user['name'])
+        """
+        fn = getattr(self, fn_name)
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as pool:
+            futures = [
+                pool.submit(fn, *(args if isinstance(args, tuple)
+                                  else (args,)))
+                for args in args_iterable]
+            for future in futures:
+                yield future.result()
+
+    def batch(self, operations):
+        """ Execute several Graph API calls in one HTTP round-trip
+
+            Facebook runs the sub-requests in parallel server-side and
+            returns one response per operation. Queues longer than
+            `BATCH_LIMIT` are transparently split into several batch calls.
+
+            Required parameters:
+                operations -- list of dictionaries in Graph batch format,
+                              e.g. [{'method': 'GET', 'relative_url': 'me'},
+                              {'method': 'GET',
+                               'relative_url': 'me/friends?limit=50'}]
+        """
+        results = []
+        for start in range(0, len(operations), BATCH_LIMIT):
+            chunk = operations[start:start + BATCH_LIMIT]
+            # the batch JSON goes in the POST body: 50 operations easily
+            # exceed what servers and proxies accept in a query string
+            responses = self._request(
+                'POST', self._url_prefix, None,
+                data={'batch': json.dumps(chunk),
+                      'access_token': self.access_token})
+            for response in responses:
+                if response is None:
+                    results.append(None)
+                    continue
+                body = response.get('body')
+                results.append(_loads(body) if body else None)
+        return results
+
+    def batching(self):
+        """ Returns a `BatchQueue` collecting calls for batch execution:
+
+                with api.batching() as queue:
+                    me = queue.get_objects('me')
+                    friends = queue.get_connections('me', 'friends')
+                print(me.result(), friends.result())
         """
-        api_method = '{}'.format(object_id)
-        return self.call('DELETE', api_method)
+        return BatchQueue(self)
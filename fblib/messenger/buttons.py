@@ -1,8 +1,13 @@
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
 from enum import Enum
 from typing import Optional, List
 
 from fblib.messenger.templates import *
-from fblib.messenger.common import Button, RequestConstructor
+from fblib.messenger.common import (Button, RequestConstructor,
+                                    _ENUM_TO_STR)
 
 
 class URLButton(Button):
@@ -35,8 +40,12 @@ class URLButton(Button):
         Reference:
         https://developers.facebook.com/docs/messenger-platform/reference/buttons/url
     """
-    type_ = 'web_url'
-    templates = [Button, GenericTemplate]
+    __slots__ = ()
+    type_ = sys.intern('web_url')
+    templates = frozenset((Button, GenericTemplate))
+    syntax_keys = ('type', 'url', 'title', 'webview_height_ratio',
+                   'messenger_extensions', 'fallback_url',
+                   'webview_share_button')
 
     def __init__(self,
                  title: str,
@@ -45,15 +54,20 @@ class URLButton(Button):
                  messenger_extensions: Optional[bool]=None,
                  fallback_url: Optional[str]=None,
                  webview_share_button: Optional[str]=None):
-        self.syntax = {
+        syntax = {
             "type": self.type_,
             "url": url,
             "title": title,
-            "webview_height_ratio": webview_height_ratio,
-            "messenger_extensions": messenger_extensions,
-            "fallback_url": fallback_url,
-            "webview_share_button": webview_share_button,
         }
+        if webview_height_ratio is not None:
+            syntax['webview_height_ratio'] = webview_height_ratio
+        if messenger_extensions is not None:
+            syntax['messenger_extensions'] = messenger_extensions
+        if fallback_url is not None:
+            syntax['fallback_url'] = fallback_url
+        if webview_share_button is not None:
+            syntax['webview_share_button'] = webview_share_button
+        self.syntax = syntax
 
 
 class PostbackButton(Button):
@@ -72,8 +86,9 @@ class PostbackButton(Button):
         Reference:
         https://developers.facebook.com/docs/messenger-platform/reference/buttons/postback
     """
-    type_ = 'postback'
-    templates = [Button, GenericTemplate]
+    __slots__ = ()
+    type_ = sys.intern('postback')
+    templates = frozenset((Button, GenericTemplate))
 
     def __init__(self, title: str, payload: str):
         self.syntax = {
@@ -109,38 +124,48 @@ class ShareButton(Button):
         Reference:
         https://developers.facebook.com/docs/messenger-platform/reference/buttons/share
     """
-    type_ = 'element_share'
-    templates = [GenericTemplate, ListTemplate, MediaTemplate]
+    __slots__ = ()
+    type_ = sys.intern('element_share')
+    templates = frozenset((GenericTemplate, ListTemplate, MediaTemplate))
+    syntax_keys = ('type', 'title')
 
     def __init__(self,
                  share_contents: Optional[GenericTemplate]=None):
-        self.syntax = {
-            'type': self.type_,
-            'title': share_contents,
-        }
+        syntax = {'type': self.type_}
+        if share_contents is not None:
+            syntax['title'] = share_contents
+        self.syntax = syntax
 
 
-class PaymentType(Enum):
+class PaymentType(str, Enum):
     FIXED_AMOUNT = 'FIXED_AMOUNT'
     FLEXIBLE_AMOUNT = 'FLEXIBLE_AMOUNT'
 
 
-class PriceList(RequestConstructor):
+_ENUM_TO_STR.update((member, member.value) for member in PaymentType)
+
+
+@dataclass(frozen=True)
+class PriceList:
     """ List of objects used to calculate total price.
         Each label is rendered as a line item in the checkout dialog.
 
+        Immutable value holder: being frozen makes instances hashable,
+        so built payloads containing them can be memoized.
+
         Args:
             label:
                 Label for line item.
             amount:
                 Amount of line item.
     """
+    label: str
+    amount: str
 
-    def __init__(self, label: str, amount: str):
-        self.syntax = {
-            'label': label,
-            'amount': amount
-        }
+    def build(self):
+        """ Convert to dict
+        """
+        return {'label': self.label, 'amount': self.amount}
 
 
 class PaymentSummary(RequestConstructor):
@@ -166,6 +191,9 @@ class PaymentSummary(RequestConstructor):
                 Whether this is a test payment.
                 Once set to true, the charge will be a dummy charge.
     """
+    __slots__ = ()
+    syntax_keys = ('currency', 'payment_type', 'is_test_payment',
+                   'merchant_name', 'requested_user_info', 'price_list')
 
     def __init__(self,
                  currency: str,
@@ -174,14 +202,16 @@ class PaymentSummary(RequestConstructor):
                  requested_user_info: list,
                  price_list: List[PriceList],
                  is_test_payment: Optional[bool]=None):
-        self.syntax = {
+        syntax = {
             'currency': currency,
             'payment_type': payment_type,
-            'is_test_payment': is_test_payment,
             'merchant_name': merchant_name,
             'requested_user_info': requested_user_info,
             'price_list': price_list
         }
+        if is_test_payment is not None:
+            syntax['is_test_payment'] = is_test_payment
+        self.syntax = syntax
 
 
 class BuyButton(Button):
@@ -218,8 +248,9 @@ class BuyButton(Button):
         You can also use the User Profile API and check the is_payment_enabled
         field to see if a user is eligible for payment before hand.
     """
-    type_ = 'payment'
-    templates = [GenericTemplate, ListTemplate, MediaTemplate]
+    __slots__ = ()
+    type_ = sys.intern('payment')
+    templates = frozenset((GenericTemplate, ListTemplate, MediaTemplate))
 
     def __init__(self,
                  title: str,
@@ -244,8 +275,10 @@ class CallButton(Button):
                 Format must have "+" prefix followed by the country code,
                 area code and local number. For example, +16505551234.
     """
-    type_ = 'phone_number'
-    templates = [GenericTemplate, ListTemplate, ButtonTemplate, MediaTemplate]
+    __slots__ = ()
+    type_ = sys.intern('phone_number')
+    templates = frozenset((GenericTemplate, ListTemplate, ButtonTemplate,
+                           MediaTemplate))
 
     def __init__(self,
                  title: str,
@@ -267,8 +300,10 @@ class LogInButton(Button):
             url:
                 Authentication callback URL. Must use HTTPS protocol.
     """
-    type_ = 'account_link'
-    templates = [GenericTemplate, ListTemplate, ButtonTemplate, MediaTemplate]
+    __slots__ = ()
+    type_ = sys.intern('account_link')
+    templates = frozenset((GenericTemplate, ListTemplate, ButtonTemplate,
+                           MediaTemplate))
 
     def __init__(self,
                  url: str):
@@ -283,8 +318,10 @@ class LogOutButton(Button):
         to unlink the message recipient's identity on Messenger
         with their account on your site.
     """
-    type_ = 'account_unlink'
-    templates = [GenericTemplate, ListTemplate, ButtonTemplate, MediaTemplate]
+    __slots__ = ()
+    type_ = sys.intern('account_unlink')
+    templates = frozenset((GenericTemplate, ListTemplate, ButtonTemplate,
+                           MediaTemplate))
 
     def __init__(self):
         self.syntax = {
@@ -292,23 +329,31 @@ class LogOutButton(Button):
         }
 
 
-class GameMetadata(RequestConstructor):
+@dataclass(frozen=True)
+class GameMetadata:
     """ Parameters specific to Instant Games.
 
+        Immutable value holder: being frozen makes instances hashable,
+        so built payloads containing them can be memoized.
+
         Args:
             player_id:
                 Player ID (Instant Game name-space) to play against.
             context_id:
                 Context ID (Instant Game name-space) of the THREAD to play in.
     """
+    player_id: Optional[str]
+    context_id: Optional[str]
 
-    def __init__(self,
-                 player_id: Optional[str],
-                 context_id: Optional[str]):
-        self.syntax = {
-            'player_id': player_id,
-            'context_id': context_id
-        }
+    def build(self):
+        """ Convert to dict, removing None's.
+        """
+        params = {}
+        if self.player_id is not None:
+            params['player_id'] = self.player_id
+        if self.context_id is not None:
+            params['context_id'] = self.context_id
+        return params
 
 
 class GamePlayButton(Button):
@@ -323,16 +368,22 @@ class GamePlayButton(Button):
             game_metadata:
                 Parameters specific to Instant Games.
     """
-    type_ = 'game_play'
-    templates = [GenericTemplate, ListTemplate, ButtonTemplate, MediaTemplate]
+    __slots__ = ()
+    type_ = sys.intern('game_play')
+    templates = frozenset((GenericTemplate, ListTemplate, ButtonTemplate,
+                           MediaTemplate))
+    syntax_keys = ('type', 'title', 'payload', 'game_metadata')
 
     def __init__(self,
                  title: str,
                  payload: Optional[str]=None,
                  game_metadata: Optional[GameMetadata]=None):
-        self.syntax = {
+        syntax = {
             'type': self.type_,
             'title': title,
-            'payload': payload,
-            'game_metadata': game_metadata
         }
+        if payload is not None:
+            syntax['payload'] = payload
+        if game_metadata is not None:
+            syntax['game_metadata'] = game_metadata
+        self.syntax = syntax
@@ -1,24 +1,159 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
 from enum import Enum
 from typing import List, Optional, Union
 
 
+def _json_default(obj):
+    """ Serialize the values the JSON encoder can't handle natively:
+        Decimal prices, nested request constructors and enum members.
+    """
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if hasattr(obj, 'build'):
+        return obj.build()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError('{!r} is not JSON serializable'.format(obj))
+
+
+try:  # optional speedup: orjson is several times faster than stdlib json
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, default=_json_default)
+except ImportError:
+    import json as _stdlib_json
+
+    def _dumps(obj):
+        return _stdlib_json.dumps(obj, default=_json_default).encode()
+
+try:  # optional binary transport for internal services
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+
+def _codegen_build(cls, keys):
+    """ Generate a build() specialized to `cls`, with one straight-line
+        block per payload key instead of a generic dict walk. The function
+        is exec'd once and attached to the class, so every later build on
+        that class runs the specialized bytecode.
+    """
+    lines = ['def _specialized_build(self):',
+             '    s = self.syntax',
+             '    d = {}']
+    for key in keys:
+        k = repr(key)
+        lines.append('    v = s.get({})'.format(k))
+        lines.append('    if v is not None:')
+        lines.append("        if hasattr(v, 'build'):")
+        lines.append('            v = v.build()')
+        lines.append('        elif type(v) is list:')
+        lines.append("            v = [x.build() if hasattr(x, 'build') "
+                     'else x for x in v]')
+        lines.append('        elif isinstance(v, Enum):')
+        lines.append('            v = _ENUM_TO_STR.get(v, v)')
+        lines.append('        d[{}] = v'.format(k))
+    lines.append('    return d')
+    namespace = {'Enum': Enum, '_ENUM_TO_STR': _ENUM_TO_STR}
+    exec('\n'.join(lines), namespace)
+    fn = namespace['_specialized_build']
+    setattr(cls, '_specialized_build', fn)
+    return fn
+
+
+#: payloads shared across instances, keyed by class and syntax contents.
+#: Constructors whose syntax holds only primitive values (e.g. the static
+#: account-linking buttons, or any button built repeatedly with the same
+#: arguments) resolve to one shared dict instead of rebuilding it.
+#: Bounded so unique payloads (a bulk send builds one Recipient per user)
+#: cannot grow it without limit; at the cap it simply stops admitting
+#: new entries, the static ones having been inserted long before.
+_BUILT_CACHE = {}
+_BUILT_CACHE_LIMIT = 1024
+
+#: syntax values eligible for the shared cache; anything else (nested
+#: constructors, lists, enums) would hash by identity and never be hit
+#: again, pinning the objects in memory for nothing
+_CACHEABLE_TYPES = (str, int, bool)
+
+
 class RequestConstructor:
     """ Construct requests to Facebook Messenger API.
+        Instances only carry the `syntax` dict plus a cache of the built
+        payload; `__slots__` keeps them free of a per-instance `__dict__`.
+        Constructors are treated as immutable once built.
     """
-    syntax = {}
+    __slots__ = ('syntax', '_built', '_bytes')
 
     def build(self):
         """ Convert self.syntax to dict, removing None's.
+
+            Dispatches to a per-class specialized function generated on
+            first use; classes may declare their payload keys up front via
+            a `syntax_keys` class attribute, otherwise the keys of the
+            first built instance are used. The result is memoized on the
+            instance and, when the syntax holds only primitive values, in
+            the bounded module-level `_BUILT_CACHE`, so equal constructors
+            share one built dict.
         """
-        params = {}
-        for k, v in self.syntax.items():
-            if v is None:
-                continue
-            if hasattr(v, 'build'):
-                params[k] = v.build()
-            else:
-                params[k] = v
-        return params
+        built = getattr(self, '_built', None)
+        if built is not None:
+            return built
+        cls = type(self)
+        syntax = self.syntax
+        for value in syntax.values():
+            if value is not None and type(value) not in _CACHEABLE_TYPES:
+                cache_key = None
+                break
+        else:
+            cache_key = (cls, tuple(syntax.items()))
+            built = _BUILT_CACHE.get(cache_key)
+        if built is not None:
+            self._built = built
+            return built
+        fn = cls.__dict__.get('_specialized_build')
+        if fn is None:
+            keys = getattr(cls, 'syntax_keys', None) or tuple(syntax)
+            fn = _codegen_build(cls, keys)
+        built = self._built = fn(self)
+        if cache_key is not None and len(_BUILT_CACHE) < _BUILT_CACHE_LIMIT:
+            _BUILT_CACHE[cache_key] = built
+        return built
+
+    def to_json(self):
+        """ Serialize the built payload to JSON bytes.
+            Uses orjson when installed (`pip install fblib[speedups]`),
+            falling back to stdlib json; Decimal values are rendered as
+            strings, as the Graph API expects.
+        """
+        return _dumps(self.build())
+
+    def to_bytes(self):
+        """ Serialized payload bytes, encoded once per instance.
+            Constructors are immutable once built, so the bytes are
+            memoized in a slot (`functools.cached_property` needs a
+            `__dict__`, which `__slots__` removes). A Recipient reused
+            across several sends, or a Template sent to many recipients,
+            is encoded a single time.
+        """
+        data = getattr(self, '_bytes', None)
+        if data is None:
+            data = self._bytes = _dumps(self.build())
+        return data
+
+    def to_cbor(self):
+        """ Serialize the built payload to CBOR bytes, roughly halving
+            the on-wire size for transport to internal services.
+            Requires the `cbor2` package (`pip install fblib[cbor]`).
+        """
+        if cbor2 is None:
+            raise RuntimeError(
+                "the 'cbor2' package is required for to_cbor()")
+        return cbor2.dumps(self.build())
 
 
 class Recipient(RequestConstructor):
@@ -41,6 +176,7 @@ class Recipient(RequestConstructor):
                     {"first_name":"John", "last_name":"Doe"}
                 Providing a name increases the odds of a successful match.
     """
+    __slots__ = ()
 
     def __init__(self, id_: str,
                  phone_number: Optional[str]=None,
@@ -54,7 +190,7 @@ class Recipient(RequestConstructor):
         }
 
 
-class MessagingType(Enum):
+class MessagingType(str, Enum):
     """ The messaging_type property identifies the messaging type of the
         message being sent, and is a more explicit way to ensure bots are
         complying with policies for specific messaging types and respecting
@@ -85,9 +221,13 @@ class MessagingType(Enum):
     MESSAGE_TAG = 'MESSAGE_TAG'
 
 
-class Payload(RequestConstructor):
+@dataclass(frozen=True)
+class Payload:
     """ Payload for rich media message.
 
+        Immutable value holder: being frozen makes instances hashable, so
+        built payloads containing them can be memoized.
+
         Args:
             url:
                 attachment from a URL
@@ -102,22 +242,32 @@ class Payload(RequestConstructor):
         Description:
         https://developers.facebook.com/docs/messenger-platform/send-messages
     """
+    url: Optional[str] = None
+    file: Optional[str] = None  # TODO: add file uploading option
+    attachment_id: Optional[str] = None
+    is_reusable: Optional[bool] = None
 
-    def __init__(self,
-                 url: Optional[str]=None,
-                 file: Optional[str]=None,  # TODO: add file uploading option
-                 attachment_id: Optional[str]=None,
-                 is_reusable: Optional[bool]=None):
-        self.syntax = {
-            'url': url,
-            'attachment_id': attachment_id,
-            'is_reusable': is_reusable
-        }
+    def build(self):
+        """ Convert to dict, removing None's (`file` is not sent yet).
+        """
+        params = {}
+        if self.url is not None:
+            params['url'] = self.url
+        if self.attachment_id is not None:
+            params['attachment_id'] = self.attachment_id
+        if self.is_reusable is not None:
+            params['is_reusable'] = self.is_reusable
+        return params
 
 
 class Template(RequestConstructor):
     """ Description of the template.
+        Templates are never mutated after construction, so the serialized
+        payload bytes are cached on the instance: sending one template to
+        many recipients pays for a single encode (see
+        `RequestConstructor.to_bytes`).
     """
+    __slots__ = ()
 
 
 class Attachment(RequestConstructor):
@@ -136,6 +286,7 @@ class Attachment(RequestConstructor):
         Reference:
         https://developers.facebook.com/docs/messenger-platform/reference/send-api/
     """
+    __slots__ = ()
 
     def __init__(self,
                  type_: str,
@@ -178,6 +329,7 @@ class QuickReply(RequestConstructor):
         Reference:
         https://developers.facebook.com/docs/messenger-platform/reference/send-api/quick-replies
     """
+    __slots__ = ()
 
     def __init__(self,
                  content_type: str,
@@ -215,6 +367,7 @@ class Message(RequestConstructor):
         Reference:
         https://developers.facebook.com/docs/messenger-platform/reference/send-api/
     """
+    __slots__ = ()
 
     def __init__(self,
                  text: Optional[str]=None,
@@ -229,7 +382,7 @@ class Message(RequestConstructor):
         }
 
 
-class MessageTag(Enum):
+class MessageTag(str, Enum):
     """ Message tags give you the ability to send messages to a person outside
         of the normally allowed 24-hour window for a limited number of purposes
         that require continual notification or updates. This enables greater
@@ -309,6 +462,14 @@ class MessageTag(Enum):
     TICKET_UPDATE = 'TICKET_UPDATE'
 
 
+#: precomputed member -> value maps, so build() replaces the Enum
+#: __getattribute__ descriptor chain with one dict lookup
+#: (buttons.py registers PaymentType here as well)
+_ENUM_TO_STR = {member: member.value
+                for enum_cls in (MessagingType, MessageTag)
+                for member in enum_cls}
+
+
 class Request(RequestConstructor):
     """ The body of the HTTP request in JSON format.
 
@@ -339,6 +500,7 @@ class Request(RequestConstructor):
         Reference:
         https://developers.facebook.com/docs/messenger-platform/reference/send-api/
     """
+    __slots__ = ()
 
     def __init__(self,
                  messaging_type: MessagingType,
@@ -363,5 +525,6 @@ class Button(RequestConstructor):
 
         https://developers.facebook.com/docs/messenger-platform/send-messages/buttons
     """
+    __slots__ = ()
     type_ = 'Button type'
-    templates = []
+    templates = frozenset()
@@ -1,14 +1,71 @@
+from __future__ import annotations
+
+from urllib.parse import urlencode
+
 import requests
 
-from fblib.core import FacebookError
+from fblib.core import BATCH_LIMIT, FacebookError
+from fblib.messenger.common import _json_default
+
+from enum import Enum
+
+
+try:  # optional speedup: orjson is several times faster than stdlib json
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj):
+        return orjson.dumps(obj, default=_json_default)
+except ImportError:
+    import json as _stdlib_json
+
+    def _loads(data):
+        return _stdlib_json.loads(data)
+
+    def _dumps(obj):
+        return _stdlib_json.dumps(obj, default=_json_default).encode()
 
 
 class SendAPI:
     api_url = 'https://graph.facebook.com'
     api_version = 'v2.6'
+    __slots__ = ('access_token', '_url_prefix', '_urls', '_session',
+                 '_encoded_token')
 
     def __init__(self, access_token):
         self.access_token = access_token
+        self._url_prefix = '{}/{}/'.format(self.api_url, self.api_version)
+        self._urls = {}
+        # percent-encode the token once instead of per request
+        self._encoded_token = urlencode({'access_token': access_token})
+        # keep-alive session: amortizes the TLS handshake over all sends
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4,
+                                                pool_maxsize=16)
+        self._session.mount('https://', adapter)
+
+    def _url(self, api_method):
+        """ Returns the full endpoint URL, memoized per api_method so hot
+            endpoints like 'me/messages' are joined only once.
+        """
+        try:
+            return self._urls[api_method]
+        except KeyError:
+            url = self._urls[api_method] = self._url_prefix + api_method
+            return url
+
+    def close(self):
+        """ Release the pooled connections held by the session.
+        """
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _call_api(self, http_method, api_method, json=None, files=None,
                   **kwargs):
@@ -23,14 +80,28 @@ class SendAPI:
                     dictionary that specifying additional data to send
                     to the server
         """
-        url = '/'.join((self.api_url, self.api_version, api_method))
-        params = dict(access_token=self.access_token)
-        params.update(kwargs)
-        res = requests.request(http_method, url, params=params, files=files,
-                               json=json)
-        if hasattr(res.json, '__contains__') and 'error' in res.json:
-            raise FacebookError(res.json)
-        return res
+        if kwargs:
+            url = self._url(api_method)
+            params = {'access_token': self.access_token, **kwargs}
+        else:
+            # splice the pre-encoded token in directly, skipping
+            # requests' per-call query-string encoding
+            url = self._url(api_method) + '?' + self._encoded_token
+            params = None
+        if files is not None:
+            res = self._session.request(http_method, url, params=params,
+                                        files=files, json=json)
+        elif json is not None:
+            res = self._session.request(http_method, url, params=params,
+                                        data=_dumps(json),
+                                        headers={'Content-Type':
+                                                 'application/json'})
+        else:
+            res = self._session.request(http_method, url, params=params)
+        data = _loads(res.content)
+        if isinstance(data, dict) and 'error' in data:
+            raise FacebookError(data)
+        return data
 
     def page_message_tags(self):
         """ Retrieve the current list of supported tags.
@@ -47,3 +118,94 @@ class SendAPI:
         api_method = 'me/messages'
         template = message.build() if hasattr(message, 'build') else message
         return self._call_api('POST', api_method, json=template)
+
+    def send_to_many(self, template, recipient_ids, messaging_type='UPDATE',
+                     tag=None):
+        """ Send the same template payload to many recipients.
+
+            The template body is serialized once (`Template.to_bytes`
+            memoizes the bytes on the instance) and each request is
+            assembled by splicing the short per-recipient envelope around
+            the cached payload, so N sends pay for one payload encode.
+
+            Recipients may be given as plain PSID strings or as
+            `Recipient` objects; the latter carry their own cached
+            envelope bytes, so a Recipient reused across several blasts
+            is encoded once for all of them.
+
+            Args:
+                template:
+                    a Template instance (or an already-built dict)
+                recipient_ids:
+                    iterable of recipient PSIDs or Recipient objects
+                messaging_type:
+                    the messaging type of the messages being sent
+                tag:
+                    optional message tag for sends outside the standard
+                    messaging window
+
+            Returns the parsed response for each recipient in input order.
+        """
+        payload = (template.to_bytes() if hasattr(template, 'to_bytes')
+                   else _dumps(template))
+        prefix = b'{"messaging_type":' + _dumps(
+            messaging_type.value if isinstance(messaging_type, Enum)
+            else messaging_type)
+        if tag is not None:
+            prefix += b',"tag":' + _dumps(
+                tag.value if isinstance(tag, Enum) else tag)
+        suffix = (b',"message":{"attachment":{"type":"template","payload":'
+                  + payload + b'}}}')
+        url = self._url('me/messages') + '?' + self._encoded_token
+        headers = {'Content-Type': 'application/json'}
+        results = []
+        for recipient in recipient_ids:
+            envelope = (recipient.to_bytes()
+                        if hasattr(recipient, 'to_bytes')
+                        else _dumps({'id': recipient}))
+            body = prefix + b',"recipient":' + envelope + suffix
+            res = self._session.request('POST', url, data=body,
+                                        headers=headers)
+            data = _loads(res.content)
+            if isinstance(data, dict) and 'error' in data:
+                raise FacebookError(data)
+            results.append(data)
+        return results
+
+    def send_messages(self, messages):
+        """ Send several messages in one batch HTTP request
+
+            Packs up to `BATCH_LIMIT` built payloads per POST to the Graph
+            batch endpoint, so N sends cost ceil(N/50) round-trips instead
+            of N. Returns the parsed sub-response for each message in input
+            order.
+
+            Args:
+                messages:
+                    list of Request objects (or already-built dicts)
+
+            Reference:
+            https://developers.facebook.com/docs/graph-api/making-multiple-requests
+        """
+        results = []
+        for start in range(0, len(messages), BATCH_LIMIT):
+            batch = []
+            for message in messages[start:start + BATCH_LIMIT]:
+                template = (message.build() if hasattr(message, 'build')
+                            else message)
+                body = urlencode(
+                    {k: (v if isinstance(v, str) else _dumps(v).decode())
+                     for k, v in template.items()})
+                batch.append({'method': 'POST',
+                              'relative_url': 'me/messages',
+                              'body': body})
+            res = self._session.request(
+                'POST', self.api_url + '/?' + self._encoded_token,
+                data={'batch': _dumps(batch)})
+            data = _loads(res.content)
+            if isinstance(data, dict) and 'error' in data:
+                raise FacebookError(data)
+            for response in data:
+                body = response.get('body') if response else None
+                results.append(_loads(body) if body else None)
+        return results
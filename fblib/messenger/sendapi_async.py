@@ -0,0 +1,83 @@
+"""
+Asyncio counterpart of `fblib.messenger.sendapi` built on aiohttp, so a
+bot serving many users can overlap its sends on one event loop:
+
+    async with AsyncSendAPI(access_token) as api:
+        await asyncio.gather(*[api.send_message(m) for m in messages])
+
+Requires the `aiohttp` package (`pip install fblib[async]`).
+"""
+import aiohttp
+
+from fblib.core import FacebookError
+from fblib.messenger.sendapi import _dumps, _loads
+
+
+class AsyncSendAPI:
+    api_url = 'https://graph.facebook.com'
+    api_version = 'v2.6'
+    __slots__ = ('access_token', '_url_prefix', '_session')
+
+    def __init__(self, access_token):
+        self.access_token = access_token
+        self._url_prefix = '{}/{}/'.format(self.api_url, self.api_version)
+        self._session = None
+
+    @property
+    def session(self):
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def _call_api(self, http_method, api_method, json=None, **kwargs):
+        """ Basic method for calling Facebook Messenger Api
+
+            Args:
+                http_method:
+                    HTTP request methods, e.g. 'POST', 'GET', etc.
+                api_method:
+                    part of URL after `self.api_url`
+                kwargs:
+                    dictionary that specifying additional data to send
+                    to the server
+        """
+        url = self._url_prefix + api_method
+        params = {'access_token': self.access_token, **kwargs}
+        if json is not None:
+            request = self.session.request(
+                http_method, url, params=params, data=_dumps(json),
+                headers={'Content-Type': 'application/json'})
+        else:
+            request = self.session.request(http_method, url, params=params)
+        async with request as res:
+            data = _loads(await res.read())
+        if isinstance(data, dict) and 'error' in data:
+            raise FacebookError(data)
+        return data
+
+    async def page_message_tags(self):
+        """ Retrieve the current list of supported tags.
+        """
+        return await self._call_api('GET', 'page_message_tags')
+
+    async def send_message(self, message):
+        """
+
+            Reference:
+            https://developers.facebook.com/docs/messenger-platform/send-messages
+        """
+        template = message.build() if hasattr(message, 'build') else message
+        return await self._call_api('POST', 'me/messages', json=template)
+
+    async def close(self):
+        """ Release the connections held by the aiohttp session.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
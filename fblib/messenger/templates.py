@@ -1,16 +1,65 @@
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
 from decimal import Decimal
-from typing import Optional, List, Union
+from itertools import repeat
+from typing import NamedTuple, Optional, List, Union
 
 from fblib.messenger.common import (
     Button,
     Template,
     RequestConstructor,
+    _codegen_build,
 )
 
+_TWO_PLACES = Decimal('0.01')
+
+
+def _format_price(value):
+    """ Render a Decimal as the price string the receipt endpoint
+        expects: '.'-separated with two decimal places. Formatting once
+        up front keeps Decimal.__str__ out of the per-send encode loop.
+        Non-Decimal values (None, pre-formatted strings) pass through.
+    """
+    if isinstance(value, Decimal):
+        return str(value.quantize(_TWO_PLACES))
+    return value
+
+
+def _build(value):
+    """ Build a nested constructor or a list of them, passing plain
+        values (and prebuilt dicts) through untouched.
+    """
+    if hasattr(value, 'build'):
+        return value.build()
+    if type(value) is list:
+        return [x.build() if hasattr(x, 'build') else x for x in value]
+    return value
+
+
+def _pack(**kw):
+    """ Assemble a payload dict from keyword arguments, omitting unset
+        (None) fields entirely instead of storing them and filtering
+        later. In this API None always means "omit": the Graph endpoints
+        reject explicit nulls, so no sentinel is needed to tell the two
+        apart.
+    """
+    return {k: v for k, v in kw.items() if v is not None}
+
 
-class DefaultAction(RequestConstructor):
+_WEB_URL = sys.intern('web_url')
+
+
+def default_action(url: str,
+                   webview_height_ratio: Optional[str]=None,
+                   messenger_extensions: Optional[bool]=None,
+                   fallback_url: Optional[str]=None,
+                   webview_share_button: Optional[str]=None) -> dict:
     """ The default action executed when the template is tapped.
         Accepts the same properties as URL button, except title.
+        Returns the payload dict directly - no wrapper object to build
+        and discard per element.
 
         Args:
             url:
@@ -36,26 +85,25 @@ class DefaultAction(RequestConstructor):
         Reference:
         https://developers.facebook.com/docs/messenger-platform/reference/buttons/url
     """
-    type_ = 'web_url'
+    return _pack(type=_WEB_URL, url=url,
+                 webview_height_ratio=webview_height_ratio,
+                 messenger_extensions=messenger_extensions,
+                 fallback_url=fallback_url,
+                 webview_share_button=webview_share_button)
 
-    def __init__(self,
-                 url: str,
-                 webview_height_ratio: Optional[str]=None,
-                 messenger_extensions: Optional[bool]=None,
-                 fallback_url: Optional[str]=None,
-                 webview_share_button: Optional[str]=None):
-        self.syntax = {
-            'type': self.type_,
-            'url': url,
-            'webview_height_ratio': webview_height_ratio,
-            'messenger_extensions': messenger_extensions,
-            'fallback_url': fallback_url,
-            'webview_share_button': webview_share_button,
-        }
+
+#: kept as an alias for API stability
+DefaultAction = default_action
 
 
-class GenericElement(RequestConstructor):
+def generic_element(title: str,
+                    subtitle: Optional[str]=None,
+                    image_url: Optional[str]=None,
+                    default_action: Optional[dict]=None,
+                    buttons: Optional[List[Button]]=None) -> dict:
     """ The generic element.
+        Returns the payload dict directly; nested constructors (buttons,
+        default_action) are built in place.
 
         Args:
             title:
@@ -70,21 +118,13 @@ class GenericElement(RequestConstructor):
                 An array of buttons to append to the template.
                 A maximum of 3 buttons per element is supported.
     """
+    return _pack(title=title, image_url=image_url, subtitle=subtitle,
+                 default_action=_build(default_action),
+                 buttons=_build(buttons))
 
-    def __init__(self,
-                 title: str,
-                 subtitle: Optional[str]=None,
-                 image_url: Optional[str]=None,
-                 default_action: Optional[DefaultAction]=None,
-                 buttons: Optional[List[Button]]=None
-                 ):
-        self.syntax = {
-            'title': title,
-            'image_url': image_url,
-            'subtitle': subtitle,
-            'default_action': default_action,
-            'buttons': buttons
-        }
+
+#: kept as an alias for API stability
+GenericElement = generic_element
 
 
 class GenericTemplate(Template):
@@ -104,15 +144,21 @@ class GenericTemplate(Template):
         Implementation:
         https://developers.facebook.com/docs/messenger-platform/send-messages/template/generic
     """
-    template_type = 'generic'
+    template_type = sys.intern('generic')
+    __slots__ = ('elements',)
+    syntax_keys = ('template_type', 'elements')
+    _SYNTAX_PROTO = {'template_type': template_type, 'elements': None}
 
     def __init__(self,
                  elements: Union[List[GenericElement],
                                  List['GenericTemplate']]):
-        self.syntax = {
-            'template_type': self.template_type,
-            'elements': elements
-        }
+        self.elements = elements
+
+    @property
+    def syntax(self):
+        s = self._SYNTAX_PROTO.copy()
+        s['elements'] = self.elements
+        return s
 
 
 class ListTemplate(Template):
@@ -142,19 +188,30 @@ class ListTemplate(Template):
         Implementation:
         https://developers.facebook.com/docs/messenger-platform/send-messages/template/list
     """
-    template_type = 'list'
+    template_type = sys.intern('list')
+    __slots__ = ('elements', 'top_element_style', 'buttons')
+    syntax_keys = ('template_type', 'top_element_style', 'buttons',
+                   'elements')
+    _SYNTAX_PROTO = {'template_type': template_type, 'elements': None}
 
     def __init__(self,
                  elements: List[GenericElement],
                  top_element_style: Optional[str]=None,
                  buttons: Optional[List[Button]]=None
                  ):
-        self.syntax = {
-            'template_type': self.template_type,
-            'top_element_style': top_element_style,
-            'buttons': buttons,
-            'elements': elements
-        }
+        self.elements = elements
+        self.top_element_style = top_element_style
+        self.buttons = buttons
+
+    @property
+    def syntax(self):
+        s = self._SYNTAX_PROTO.copy()
+        s['elements'] = self.elements
+        if self.top_element_style is not None:
+            s['top_element_style'] = self.top_element_style
+        if self.buttons is not None:
+            s['buttons'] = self.buttons
+        return s
 
 
 class ButtonTemplate(Template):
@@ -174,17 +231,25 @@ class ButtonTemplate(Template):
         Implementation:
         https://developers.facebook.com/docs/messenger-platform/send-messages/template/button
     """
-    template_type = 'button'
+    template_type = sys.intern('button')
+    __slots__ = ('text', 'buttons')
+    syntax_keys = ('template_type', 'text', 'buttons')
+    _SYNTAX_PROTO = {'template_type': template_type, 'text': None}
 
     def __init__(self,
                  text: str,
                  buttons: Optional[List[Button]] = None
                  ):
-        self.syntax = {
-            'template_type': self.template_type,
-            'text': text,
-            'buttons': buttons
-        }
+        self.text = text
+        self.buttons = buttons
+
+    @property
+    def syntax(self):
+        s = self._SYNTAX_PROTO.copy()
+        s['text'] = self.text
+        if self.buttons is not None:
+            s['buttons'] = self.buttons
+        return s
 
 
 class OpenGraphTemplate(Template):
@@ -216,20 +281,35 @@ class OpenGraphTemplate(Template):
         Implementation:
         https://developers.facebook.com/docs/messenger-platform/send-messages/template/open-graph
     """
-    template_type = 'open_graph'
+    template_type = sys.intern('open_graph')
+    __slots__ = ('url', 'buttons')
+    syntax_keys = ('template_type', 'url', 'buttons')
+    _SYNTAX_PROTO = {'template_type': template_type, 'url': None}
 
     def __init__(self,
                  url: str,
                  buttons: List[Button] = None):
-        self.syntax = {
-            'template_type': self.template_type,
-            'url': url,
-            'buttons': buttons
-        }
-
-
-class ReceiptElements(RequestConstructor):
+        self.url = url
+        self.buttons = buttons
+
+    @property
+    def syntax(self):
+        s = self._SYNTAX_PROTO.copy()
+        s['url'] = self.url
+        if self.buttons is not None:
+            s['buttons'] = self.buttons
+        return s
+
+
+def receipt_elements(title: str,
+                     price: Decimal,
+                     subtitle: Optional[str],
+                     quantity: Optional[int],
+                     currency: Optional[str],
+                     image_url: Optional[str]) -> dict:
     """ Receipt elements.
+        Returns the payload dict directly, with the Decimal price
+        formatted in place.
 
         Args:
             title:
@@ -245,29 +325,25 @@ class ReceiptElements(RequestConstructor):
             image_url:
                 The URL of an image to be displayed with the item.
     """
+    return _pack(title=title, subtitle=subtitle, quantity=quantity,
+                 price=_format_price(price), currency=currency,
+                 image_url=image_url)
 
-    def __init__(self,
-                 title: str,
-                 price: Decimal,
-                 subtitle: Optional[str],
-                 quantity: Optional[int],
-                 currency: Optional[str],
-                 image_url: Optional[str]):
-        self.syntax = {
-            'title': title,
-            'subtitle': subtitle,
-            'quantity': quantity,
-            'price': price,
-            'currency': currency,
-            'image_url': image_url
-        }
+
+#: kept as an alias for API stability
+ReceiptElements = receipt_elements
 
 
-class Summary(RequestConstructor):
+def summary(total_cost: Decimal,
+            subtotal: Optional[Decimal],
+            shipping_cost: Optional[Decimal],
+            total_tax: Optional[Decimal]) -> dict:
     """ The property values of the summary object
         should be valid, well-formatted decimal numbers,
         using '.' (dot) as the decimal separator.
         Please note that most currencies only accept up to 2 decimal places.
+        Returns the payload dict directly, with the Decimal values
+        formatted in place.
 
         Args:
             total_cost:
@@ -280,23 +356,22 @@ class Summary(RequestConstructor):
             total_tax:
                 The tax of the order.
     """
+    return _pack(total_cost=_format_price(total_cost),
+                 subtotal=_format_price(subtotal),
+                 shipping_cost=_format_price(shipping_cost),
+                 total_tax=_format_price(total_tax))
 
-    def __init__(self,
-                 total_cost: Decimal,
-                 subtotal: Optional[Decimal],
-                 shipping_cost: Optional[Decimal],
-                 total_tax: Optional[Decimal]):
-        self.syntax = {
-            'total_cost': total_cost,
-            'subtotal': subtotal,
-            'shipping_cost': shipping_cost,
-            'total_tax': total_tax
-        }
+
+#: kept as an alias for API stability
+Summary = summary
 
 
-class Address(RequestConstructor):
+class Address(NamedTuple):
     """ Address
 
+        A plain value object: the NamedTuple stores its fields in one
+        tuple allocation, with no per-instance dict.
+
         Args:
             street_1:
                 The street address, line 1.
@@ -312,39 +387,38 @@ class Address(RequestConstructor):
             street_2:
                 The street address, line 2.
     """
+    street_1: str
+    city: str
+    postal_code: str
+    state: str
+    country: str
+    street_2: Optional[str] = None
 
-    def __init__(self,
-                 street_1: str,
-                 city: str,
-                 postal_code: str,
-                 state: str,
-                 country: str,
-                 street_2: Optional[str]=None):
-        self.syntax = {
-            'street_1': street_1,
-            'city': city,
-            'postal_code': postal_code,
-            'state': state,
-            'country': country,
-            'street_2': street_2
-        }
+    def build(self):
+        """ Convert to dict, removing None's.
+        """
+        return {k: v for k, v in zip(self._fields, self) if v is not None}
 
 
-class Adjustment(RequestConstructor):
+class Adjustment(NamedTuple):
     """ Adjustment
 
+        A plain value object: the NamedTuple stores its fields in one
+        tuple allocation, with no per-instance dict.
+
         Args:
             name:
                 Name of the adjustment.
             amount:
                 The amount of the adjustment.
     """
+    name: str
+    amount: Decimal
 
-    def __init__(self, name: str, amount: Decimal):
-        self.syntax = {
-            'name': name,
-            'amount': amount
-        }
+    def build(self):
+        """ Convert to dict, formatting the Decimal amount once.
+        """
+        return {'name': self.name, 'amount': _format_price(self.amount)}
 
 
 class ReceiptTemplate(Template):
@@ -387,7 +461,18 @@ class ReceiptTemplate(Template):
         Implementation:
         https://developers.facebook.com/docs/messenger-platform/send-messages/template/receipt
     """
-    template_type = 'receipt'
+    template_type = sys.intern('receipt')
+    __slots__ = ('recipient_name', 'order_number', 'currency',
+                 'payment_method', 'summary', 'sharable', 'merchant_name',
+                 'timestamp', 'elements', 'address', 'adjustments')
+    syntax_keys = ('template_type', 'sharable', 'recipient_name',
+                   'merchant_name', 'order_number', 'currency',
+                   'payment_method', 'timestamp', 'elements', 'address',
+                   'summary', 'adjustments')
+    _SYNTAX_PROTO = {'template_type': template_type,
+                     'recipient_name': None, 'order_number': None,
+                     'currency': None, 'payment_method': None,
+                     'summary': None}
 
     def __init__(self,
                  recipient_name: str,
@@ -401,41 +486,120 @@ class ReceiptTemplate(Template):
                  elements: Optional[ReceiptElements]=None,
                  address: Optional[Address]=None,
                  adjustments: Optional[List[Adjustment]]=None):
-        self.syntax = {
-            'template_type': self.template_type,
-            'sharable': sharable,
-            'recipient_name': recipient_name,
-            'merchant_name': merchant_name,
-            'order_number': order_number,
-            'currency': currency,
-            'payment_method': payment_method,
-            'timestamp': timestamp,
-            'elements': elements,
-            'address': address,
-            'summary': summary,
-            'adjustments': adjustments
-        }
-
-
-class AuxiliaryField(RequestConstructor):
+        self.recipient_name = recipient_name
+        self.order_number = order_number
+        self.currency = currency
+        self.payment_method = payment_method
+        self.summary = summary
+        self.sharable = sharable
+        self.merchant_name = merchant_name
+        self.timestamp = timestamp
+        self.elements = elements
+        self.address = address
+        self.adjustments = adjustments
+
+    @classmethod
+    def from_columns(cls,
+                     recipient_name: str,
+                     order_number: str,
+                     currency: str,
+                     payment_method: str,
+                     summary: dict,
+                     titles: List[str],
+                     prices: List[Decimal],
+                     subtitles: Optional[List[str]]=None,
+                     quantities: Optional[List[int]]=None,
+                     currencies: Optional[List[str]]=None,
+                     image_urls: Optional[List[str]]=None,
+                     **kwargs) -> 'ReceiptTemplate':
+        """ Build a receipt from parallel columns of element data.
+
+            A commerce backend emitting bulk order confirmations usually
+            already holds the items as parallel lists; assembling the
+            element dicts in one zip loop here skips the per-item
+            receipt_elements() calls. Omitted columns are treated as
+            all-None.
+
+            Required parameters:
+                recipient_name, order_number, currency, payment_method,
+                summary - as for the regular constructor
+                titles:
+                    per-item names, one per element
+                prices:
+                    per-item prices, one per element
+            kwargs are forwarded to the regular constructor
+            (sharable, merchant_name, timestamp, address, adjustments).
+        """
+        none = repeat(None)
+        elements = []
+        append = elements.append
+        for title, price, subtitle, quantity, item_currency, image_url \
+                in zip(titles, prices, subtitles or none,
+                       quantities or none, currencies or none,
+                       image_urls or none):
+            element = {'title': title}
+            if subtitle is not None:
+                element['subtitle'] = subtitle
+            if quantity is not None:
+                element['quantity'] = quantity
+            element['price'] = _format_price(price)
+            if item_currency is not None:
+                element['currency'] = item_currency
+            if image_url is not None:
+                element['image_url'] = image_url
+            append(element)
+        return cls(recipient_name, order_number, currency, payment_method,
+                   summary, elements=elements, **kwargs)
+
+    @property
+    def syntax(self):
+        s = self._SYNTAX_PROTO.copy()
+        s['recipient_name'] = self.recipient_name
+        s['order_number'] = self.order_number
+        s['currency'] = self.currency
+        s['payment_method'] = self.payment_method
+        s['summary'] = self.summary
+        if self.sharable is not None:
+            s['sharable'] = self.sharable
+        if self.merchant_name is not None:
+            s['merchant_name'] = self.merchant_name
+        if self.timestamp is not None:
+            s['timestamp'] = self.timestamp
+        if self.elements is not None:
+            s['elements'] = self.elements
+        if self.address is not None:
+            s['address'] = self.address
+        if self.adjustments is not None:
+            s['adjustments'] = self.adjustments
+        return s
+
+
+class AuxiliaryField(NamedTuple):
     """ Flexible information to display in the auxiliary and secondary section.
 
+        A plain value object: the NamedTuple stores its fields in one
+        tuple allocation, with no per-instance dict.
+
         Args:
             label:
                 Label for the additional field.
             value:
                 Value for the additional field.
     """
+    label: str
+    value: str
 
-    def __init__(self, label: str, value: str):
-        self.syntax = {
-            'label': label,
-            'value': value,
-        }
+    def build(self):
+        """ Convert to dict
+        """
+        return {'label': self.label, 'value': self.value}
 
 
-class FlightSchedule(RequestConstructor):
+def flight_schedule(departure_time: str,
+                    boarding_time: Optional[str],
+                    arrival_time: Optional[str]) -> dict:
     """ Schedule for the flight.
+        Returns the payload dict directly.
 
         Args:
             boarding_time:
@@ -451,21 +615,21 @@ class FlightSchedule(RequestConstructor):
                 Must be in the ISO 8601-based format YYYY-MM-DDThh:mm
                 (e.g. 2015-09-26T10:30).
     """
+    return _pack(boarding_time=boarding_time,
+                 departure_time=departure_time,
+                 arrival_time=arrival_time)
 
-    def __init__(self,
-                 departure_time: str,
-                 boarding_time: Optional[str],
-                 arrival_time: Optional[str]):
-        self.syntax = {
-            'boarding_time': boarding_time,
-            'departure_time': departure_time,
-            'arrival_time': arrival_time
-        }
 
+#: kept as an alias for API stability
+FlightSchedule = flight_schedule
 
-class DepartureAirport(RequestConstructor):
+
+class DepartureAirport(NamedTuple):
     """ Departure airport.
 
+        A plain value object: the NamedTuple stores its fields in one
+        tuple allocation, with no per-instance dict.
+
         Args:
             airport_code:
                 Airport code of the departure airport.
@@ -476,41 +640,45 @@ class DepartureAirport(RequestConstructor):
             gate:
                 Gate for the departing flight.
     """
+    airport_code: str
+    city: str
+    terminal: str
+    gate: str
 
-    def __init__(self,
-                 airport_code: str,
-                 city: str,
-                 terminal: str,
-                 gate: str):
-        self.syntax = {
-            'airport_code': airport_code,
-            'city': city,
-            'terminal': terminal,
-            'gate': gate
-        }
+    def build(self):
+        """ Convert to dict
+        """
+        return self._asdict()
 
 
-class ArrivalAirport(RequestConstructor):
+class ArrivalAirport(NamedTuple):
     """ Departure airport.
 
+        A plain value object: the NamedTuple stores its fields in one
+        tuple allocation, with no per-instance dict.
+
         Args:
             airport_code:
                 Airport code of the departure airport.
             city:
                 Departure city of the flight.
     """
+    airport_code: str
+    city: str
 
-    def __init__(self,
-                 airport_code: str,
-                 city: str):
-        self.syntax = {
-            'airport_code': airport_code,
-            'city': city
-        }
+    def build(self):
+        """ Convert to dict
+        """
+        return {'airport_code': self.airport_code, 'city': self.city}
 
 
-class FlightInfo(RequestConstructor):
+def flight_info(flight_number: str,
+                departure_airport: DepartureAirport,
+                arrival_airport: ArrivalAirport,
+                flight_schedule: dict) -> dict:
     """ Information about the flight.
+        Returns the payload dict directly; the nested airport value
+        objects are built in place.
 
         Args:
             flight_number:
@@ -522,22 +690,34 @@ class FlightInfo(RequestConstructor):
             flight_schedule:
                 Schedule for the flight.
     """
-
-    def __init__(self,
-                 flight_number: str,
-                 departure_airport: DepartureAirport,
-                 arrival_airport: ArrivalAirport,
-                 flight_schedule: FlightSchedule):
-        self.syntax = {
-            'flight_number': flight_number,
-            'departure_airport': departure_airport,
-            'arrival_airport': arrival_airport,
-            'flight_schedule': flight_schedule
-        }
-
-
-class BoardingPass(RequestConstructor):
+    return {
+        'flight_number': flight_number,
+        'departure_airport': _build(departure_airport),
+        'arrival_airport': _build(arrival_airport),
+        'flight_schedule': _build(flight_schedule)
+    }
+
+
+#: kept as an alias for API stability
+FlightInfo = flight_info
+
+
+def boarding_pass(passenger_name: str,
+                  pnr_number: str,
+                  logo_image_url: str,
+                  qr_code: str,
+                  barcode_image_url: str,
+                  above_bar_code_image_url: str,
+                  flight_info: dict,
+                  travel_class: Optional[str]=None,
+                  seat: Optional[str]=None,
+                  auxiliary_fields: Optional[List[AuxiliaryField]]=None,
+                  secondary_fields: Optional[List[AuxiliaryField]]=None,
+                  header_image_url: Optional[str]=None,
+                  header_text_field: Optional[str]=None) -> dict:
     """ Boarding passes for passengers.
+        Returns the payload dict directly; nested field lists are built
+        in place.
 
         Args:
             passenger_name:
@@ -567,38 +747,23 @@ class BoardingPass(RequestConstructor):
             flight_info:
                 Information about the flight. See flight_info.
     """
+    return _pack(passenger_name=passenger_name,
+                 pnr_number=pnr_number,
+                 logo_image_url=logo_image_url,
+                 qr_code=qr_code,
+                 barcode_image_url=barcode_image_url,
+                 above_bar_code_image_url=above_bar_code_image_url,
+                 flight_info=_build(flight_info),
+                 travel_class=travel_class,
+                 seat=seat,
+                 auxiliary_fields=_build(auxiliary_fields),
+                 secondary_fields=_build(secondary_fields),
+                 header_image_url=header_image_url,
+                 header_text_field=header_text_field)
 
-    def __init__(self,
-                 passenger_name: str,
-                 pnr_number: str,
-                 logo_image_url: str,
-                 qr_code: str,
-                 barcode_image_url: str,
-                 above_bar_code_image_url: str,
-                 flight_info: FlightInfo,
-                 travel_class: Optional[str]=None,
-                 seat: Optional[str]=None,
-                 auxiliary_fields: Optional[List[AuxiliaryField]]=None,
-                 secondary_fields: Optional[List[AuxiliaryField]]=None,
-                 header_image_url: Optional[str]=None,
-                 header_text_field: Optional[str]=None
-                 ):
 
-        self.syntax = {
-            'passenger_name': passenger_name,
-            'pnr_number': pnr_number,
-            'logo_image_url': logo_image_url,
-            'qr_code': qr_code,
-            'barcode_image_url': barcode_image_url,
-            'above_bar_code_image_url': above_bar_code_image_url,
-            'flight_info': flight_info,
-            'travel_class': travel_class,
-            'seat': seat,
-            'auxiliary_fields': auxiliary_fields,
-            'secondary_fields': secondary_fields,
-            'header_image_url': header_image_url,
-            'header_text_field': header_text_field
-        }
+#: kept as an alias for API stability
+BoardingPass = boarding_pass
 
 
 class AirlineBoardingPassTemplate(Template):
@@ -627,7 +792,12 @@ class AirlineBoardingPassTemplate(Template):
         Implementation:
         https://developers.facebook.com/docs/messenger-platform/send-messages/template/airline
     """
-    template_type = 'airline_boardingpass'
+    template_type = sys.intern('airline_boardingpass')
+    __slots__ = ('intro_message', 'locale', 'boarding_pass', 'theme_color')
+    syntax_keys = ('template_type', 'intro_message', 'locale',
+                   'theme_color', 'boarding_pass')
+    _SYNTAX_PROTO = {'template_type': template_type, 'intro_message': None,
+                     'locale': None, 'boarding_pass': None}
 
     def __init__(self,
                  intro_message: str,
@@ -635,13 +805,20 @@ class AirlineBoardingPassTemplate(Template):
                  boarding_pass: List[BoardingPass],
                  theme_color: Optional[str]=None
                  ):
-        self.syntax = {
-            'template_type': self.template_type,
-            'intro_message': intro_message,
-            'locale': locale,
-            'theme_color': theme_color,
-            'boarding_pass': boarding_pass,
-        }
+        self.intro_message = intro_message
+        self.locale = locale
+        self.boarding_pass = boarding_pass
+        self.theme_color = theme_color
+
+    @property
+    def syntax(self):
+        s = self._SYNTAX_PROTO.copy()
+        s['intro_message'] = self.intro_message
+        s['locale'] = self.locale
+        s['boarding_pass'] = self.boarding_pass
+        if self.theme_color is not None:
+            s['theme_color'] = self.theme_color
+        return s
 
 
 class AirlineCheckinReminderTemplate(Template):
@@ -670,7 +847,14 @@ class AirlineCheckinReminderTemplate(Template):
         Implementation:
         https://developers.facebook.com/docs/messenger-platform/send-messages/template/airline
     """
-    template_type = 'airline_checkin'
+    template_type = sys.intern('airline_checkin')
+    __slots__ = ('intro_message', 'locale', 'checkin_url', 'flight_info',
+                 'pnr_number')
+    syntax_keys = ('template_type', 'intro_message', 'locale',
+                   'checkin_url', 'flight_info', 'pnr_number')
+    _SYNTAX_PROTO = {'template_type': template_type, 'intro_message': None,
+                     'locale': None, 'checkin_url': None,
+                     'flight_info': None}
 
     def __init__(self,
                  intro_message: str,
@@ -678,14 +862,22 @@ class AirlineCheckinReminderTemplate(Template):
                  checkin_url: str,
                  flight_info: FlightInfo,
                  pnr_number: Optional[str] = None):
-        self.syntax = {
-            'template_type': self.template_type,
-            'intro_message': intro_message,
-            'locale': locale,
-            'checkin_url': checkin_url,
-            'flight_info': flight_info,
-            'pnr_number': pnr_number,
-        }
+        self.intro_message = intro_message
+        self.locale = locale
+        self.checkin_url = checkin_url
+        self.flight_info = flight_info
+        self.pnr_number = pnr_number
+
+    @property
+    def syntax(self):
+        s = self._SYNTAX_PROTO.copy()
+        s['intro_message'] = self.intro_message
+        s['locale'] = self.locale
+        s['checkin_url'] = self.checkin_url
+        s['flight_info'] = self.flight_info
+        if self.pnr_number is not None:
+            s['pnr_number'] = self.pnr_number
+        return s
 
 
 class PassengerInfo(RequestConstructor):
@@ -700,16 +892,25 @@ class PassengerInfo(RequestConstructor):
                 Full name of passenger, including title
     """
 
+    __slots__ = ('passenger_id', 'name', 'ticket_number')
+    syntax_keys = ('passenger_id', 'ticket_number', 'name')
+
     def __init__(self,
                  passenger_id: str,
                  name: str,
                  ticket_number: Optional[str],
                  ):
-        self.syntax = {
-            'passenger_id': passenger_id,
-            'ticket_number': ticket_number,
-            'name': name
-        }
+        self.passenger_id = passenger_id
+        self.name = name
+        self.ticket_number = ticket_number
+
+    @property
+    def syntax(self):
+        return {k: v for k, v in (
+            ('passenger_id', self.passenger_id),
+            ('ticket_number', self.ticket_number),
+            ('name', self.name),
+        ) if v is not None}
 
 
 class ProductInfo(RequestConstructor):
@@ -722,10 +923,18 @@ class ProductInfo(RequestConstructor):
                 Product description.
     """
 
+    __slots__ = ('title', 'value')
+    syntax_keys = ('title', 'value')
+
     def __init__(self, title: str, value: str):
-        self.syntax = {
-            'title': title,
-            'value': value,
+        self.title = title
+        self.value = value
+
+    @property
+    def syntax(self):
+        return {
+            'title': self.title,
+            'value': self.value,
         }
 
 
@@ -747,19 +956,32 @@ class PassengerSegmentInfo(RequestConstructor):
                 Maximum of 4 items is supported.
     """
 
+    __slots__ = ('segment_id', 'passenger_id', 'seat', 'seat_type',
+                 'product_info')
+    syntax_keys = ('segment_id', 'passenger_id', 'seat', 'seat_type',
+                   'product_info')
+
     def __init__(self,
                  segment_id: str,
                  passenger_id: str,
                  seat: str,
                  seat_type: str,
                  product_info: Optional[List[ProductInfo]]=None):
-        self.syntax = {
-            'segment_id': segment_id,
-            'passenger_id': passenger_id,
-            'seat': seat,
-            'seat_type': seat_type,
-            'product_info': product_info,
-        }
+        self.segment_id = segment_id
+        self.passenger_id = passenger_id
+        self.seat = seat
+        self.seat_type = seat_type
+        self.product_info = product_info
+
+    @property
+    def syntax(self):
+        return {k: v for k, v in (
+            ('segment_id', self.segment_id),
+            ('passenger_id', self.passenger_id),
+            ('seat', self.seat),
+            ('seat_type', self.seat_type),
+            ('product_info', self.product_info),
+        ) if v is not None}
 
 
 class PriceInfo(RequestConstructor):
@@ -775,15 +997,43 @@ class PriceInfo(RequestConstructor):
                 Must be a three digit ISO-4217-3 code.
     """
 
+    __slots__ = ('title', 'amount', 'currency')
+    syntax_keys = ('title', 'amount', 'currency')
+
     def __init__(self,
                  title: str,
                  amount: Decimal,
                  currency: Optional[str]):
-        self.syntax = {
-            'title': title,
-            'amount': amount,
-            'currency': currency
-        }
+        self.title = title
+        self.amount = amount
+        self.currency = currency
+
+    @property
+    def syntax(self):
+        return {k: v for k, v in (
+            ('title', self.title),
+            ('amount', self.amount),
+            ('currency', self.currency),
+        ) if v is not None}
+
+
+@dataclass(frozen=True)
+class ItineraryData:
+    """ The booking half of an itinerary update, grouped in one struct
+        so AirlineItineraryUpdateTemplate.from_itinerary can take it as
+        a single argument instead of nine separate kwargs.
+
+        Vars: as the matching AirlineItineraryUpdateTemplate parameters.
+    """
+    pnr_number: str
+    passenger_info: List[PassengerInfo]
+    flight_info: List[dict]
+    passenger_segment_info: List[PassengerSegmentInfo]
+    total_price: Decimal
+    currency: str
+    price_info: Optional[List[PriceInfo]] = None
+    base_price: Optional[Decimal] = None
+    tax: Optional[Decimal] = None
 
 
 class AirlineItineraryUpdateTemplate(Template):
@@ -828,7 +1078,15 @@ class AirlineItineraryUpdateTemplate(Template):
         Implementation:
         https://developers.facebook.com/docs/messenger-platform/send-messages/template/airline
     """
-    template_type = 'airline_itinerary'
+    template_type = sys.intern('airline_itinerary')
+    __slots__ = ('intro_message', 'locale', 'pnr_number', 'passenger_info',
+                 'flight_info', 'passenger_segment_info', 'total_price',
+                 'currency', 'theme_color', 'price_info', 'base_price',
+                 'tax')
+    syntax_keys = ('template_type', 'intro_message', 'locale',
+                   'theme_color', 'pnr_number', 'passenger_info',
+                   'flight_info', 'passenger_segment_info', 'price_info',
+                   'base_price', 'tax', 'total_price', 'currency')
 
     def __init__(self,
                  intro_message: str,
@@ -843,21 +1101,53 @@ class AirlineItineraryUpdateTemplate(Template):
                  price_info: Optional[List[PriceInfo]]=None,
                  base_price: Optional[Decimal]=None,
                  tax: Optional[Decimal]=None):
-        self.syntax = {
-            'template_type': self.template_type,
-            'intro_message': intro_message,
-            'locale': locale,
-            'theme_color': theme_color,
-            'pnr_number': pnr_number,
-            'passenger_info': passenger_info,
-            'flight_info': flight_info,
-            'passenger_segment_info': passenger_segment_info,
-            'price_info': price_info,
-            'base_price': base_price,
-            'tax': tax,
-            'total_price': total_price,
-            'currency': currency,
-        }
+        self.intro_message = intro_message
+        self.locale = locale
+        self.pnr_number = pnr_number
+        self.passenger_info = passenger_info
+        self.flight_info = flight_info
+        self.passenger_segment_info = passenger_segment_info
+        self.total_price = total_price
+        self.currency = currency
+        self.theme_color = theme_color
+        self.price_info = price_info
+        self.base_price = base_price
+        self.tax = tax
+
+    @classmethod
+    def from_itinerary(cls,
+                       intro_message: str,
+                       locale: str,
+                       itinerary: ItineraryData,
+                       theme_color: Optional[str]=None
+                       ) -> 'AirlineItineraryUpdateTemplate':
+        """ Build the template from a single ItineraryData struct,
+            avoiding the nine-kwarg call the regular constructor needs.
+        """
+        return cls(intro_message, locale, itinerary.pnr_number,
+                   itinerary.passenger_info, itinerary.flight_info,
+                   itinerary.passenger_segment_info, itinerary.total_price,
+                   itinerary.currency, theme_color=theme_color,
+                   price_info=itinerary.price_info,
+                   base_price=itinerary.base_price, tax=itinerary.tax)
+
+    @property
+    def syntax(self):
+        return {k: v for k, v in (
+            ('template_type', self.template_type),
+            ('intro_message', self.intro_message),
+            ('locale', self.locale),
+            ('theme_color', self.theme_color),
+            ('pnr_number', self.pnr_number),
+            ('passenger_info', self.passenger_info),
+            ('flight_info', self.flight_info),
+            ('passenger_segment_info', self.passenger_segment_info),
+            ('price_info', self.price_info),
+            ('base_price', self.base_price),
+            ('tax', self.tax),
+            ('total_price', self.total_price),
+            ('currency', self.currency),
+        ) if v is not None}
 
 
 class AirlineFlightUpdateTemplate(Template):
@@ -890,7 +1180,12 @@ class AirlineFlightUpdateTemplate(Template):
         Implementation:
         https://developers.facebook.com/docs/messenger-platform/send-messages/template/airline
     """
-    template_type = 'airline_update'
+    template_type = sys.intern('airline_update')
+    __slots__ = ('intro_message', 'update_type', 'locale',
+                 'update_flight_info', 'pnr_number', 'theme_color')
+    syntax_keys = ('template_type', 'intro_message', 'locale',
+                   'theme_color', 'update_type', 'pnr_number',
+                   'update_flight_info')
 
     def __init__(self,
                  intro_message: str,
@@ -899,15 +1194,24 @@ class AirlineFlightUpdateTemplate(Template):
                  update_flight_info: FlightInfo,
                  pnr_number: Optional[str]=None,
                  theme_color: Optional[str]=None):
-        self.syntax = {
-            'template_type': self.template_type,
-            'intro_message': intro_message,
-            'locale': locale,
-            'theme_color': theme_color,
-            'update_type': update_type,
-            'pnr_number': pnr_number,
-            'update_flight_info': update_flight_info
-        }
+        self.intro_message = intro_message
+        self.update_type = update_type
+        self.locale = locale
+        self.update_flight_info = update_flight_info
+        self.pnr_number = pnr_number
+        self.theme_color = theme_color
+
+    @property
+    def syntax(self):
+        return {k: v for k, v in (
+            ('template_type', self.template_type),
+            ('intro_message', self.intro_message),
+            ('locale', self.locale),
+            ('theme_color', self.theme_color),
+            ('update_type', self.update_type),
+            ('pnr_number', self.pnr_number),
+            ('update_flight_info', self.update_flight_info),
+        ) if v is not None}
 
 
 class MediaElements(RequestConstructor):
@@ -927,17 +1231,27 @@ class MediaElements(RequestConstructor):
                 A maximum of 1 button is supported.
     """
 
+    __slots__ = ('media_type', 'attachment_id', 'url', 'buttons')
+    syntax_keys = ('media_type', 'attachment_id', 'url', 'buttons')
+
     def __init__(self,
                  media_type: str,
                  attachment_id: Optional[str]=None,
                  url: Optional[str]=None,
                  buttons: Optional[List[Button]]=None):
-        self.syntax = {
-            'media_type': media_type,
-            'attachment_id': attachment_id,
-            'url': url,
-            'buttons': buttons
-        }
+        self.media_type = media_type
+        self.attachment_id = attachment_id
+        self.url = url
+        self.buttons = buttons
+
+    @property
+    def syntax(self):
+        return {k: v for k, v in (
+            ('media_type', self.media_type),
+            ('attachment_id', self.attachment_id),
+            ('url', self.url),
+            ('buttons', self.buttons),
+        ) if v is not None}
 
 
 class MediaTemplate(Template):
@@ -956,11 +1270,32 @@ class MediaTemplate(Template):
         https://developers.facebook.com/docs/messenger-platform/send-messages/template/airline
 
     """
-    template_type = 'media'
+    template_type = sys.intern('media')
+    __slots__ = ('elements',)
+    syntax_keys = ('template_type', 'elements')
 
     def __init__(self,
                  elements: List[MediaElements]):
-        self.syntax = {
+        self.elements = elements
+
+    @property
+    def syntax(self):
+        return {
             'template_type': self.template_type,
-            'elements': elements
+            'elements': self.elements
         }
+
+
+#: declarative schema of every request-constructor class in this module;
+#: their specialized build() functions are generated from syntax_keys
+#: right here at import time, so no send ever pays the codegen cost
+_SCHEMA = (GenericTemplate, ListTemplate, ButtonTemplate,
+           OpenGraphTemplate, ReceiptTemplate,
+           AirlineBoardingPassTemplate, AirlineCheckinReminderTemplate,
+           PassengerInfo, ProductInfo, PassengerSegmentInfo, PriceInfo,
+           AirlineItineraryUpdateTemplate, AirlineFlightUpdateTemplate,
+           MediaElements, MediaTemplate)
+
+for _cls in _SCHEMA:
+    _codegen_build(_cls, _cls.syntax_keys)
+del _cls
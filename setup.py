@@ -9,24 +9,51 @@ from fblib import __version__
 def read(fname):
     return open(os.path.join(os.path.dirname(__file__), fname)).read()
 
+
+#: commands that actually ship the long description; plain installs and
+#: egg_info skip the README read entirely
+_METADATA_COMMANDS = frozenset(('sdist', 'bdist_wheel', 'upload',
+                                'register', 'publish'))
+
+
+def _long_description():
+    if _METADATA_COMMANDS.intersection(sys.argv[1:]):
+        return read('README.rst')
+    return None
+
 if sys.argv[-1] == 'publish':
     os.system('python setup.py sdist upload')
     sys.exit()
 
-requirements = ['requests']
+# Opt-in speedup: compile the messenger request-builder hot path with
+# Cython in pure-python mode. The .py source stays authoritative and is
+# used unchanged when the extension is absent.
+ext_modules = []
+if os.environ.get('FBLIB_ENABLE_SPEEDUPS') == '1':
+    from Cython.Build import cythonize
+    ext_modules = cythonize(['fblib/messenger/common.py',
+                             'fblib/messenger/templates.py'],
+                            language_level=3)
 
 setup(name='fblib',
       version=".".join(map(str, __version__)),
       description='Alternative version of Facebook Python SDK',
-      long_description=read('README.rst'),
+      long_description=_long_description(),
       author='Kirill Karmadonov',
       author_email='kirill@live.com',
       url='https://github.com/0xKirill/fblib',
-      install_requires=['requests==2.19.1'],
+      install_requires=['requests>=2.25,<3'],
+      extras_require={'async': ['aiohttp'],
+                      'cbor': ['cbor2'],
+                      'http2': ['httpx[http2]'],
+                      'speedups': ['orjson'],
+                      'test': ['pytest', 'pytest-xdist', 'vcrpy']},
       packages=find_packages(exclude=['tests']),
       package_dir={'fblib': 'fblib'},
       include_package_data=True,
-      license=open('LICENSE').read(),
+      python_requires='>=3.9',
+      ext_modules=ext_modules,
+      license='ISC',
       classifiers=[
           'Development Status :: 5 - Production/Stable',
           'Environment :: Web Environment',
@@ -35,6 +62,8 @@ setup(name='fblib',
           'Natural Language :: English',
           'Operating System :: OS Independent',
           'Programming Language :: Python',
-          'Programming Language :: Python :: 3.6',
-          'Programming Language :: Python :: 3.7',
+          'Programming Language :: Python :: 3.9',
+          'Programming Language :: Python :: 3.10',
+          'Programming Language :: Python :: 3.11',
+          'Programming Language :: Python :: 3.12',
       ])
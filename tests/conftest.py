@@ -0,0 +1,5 @@
+import os
+import sys
+
+# make the in-tree fblib importable when pytest runs from a checkout
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
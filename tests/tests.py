@@ -0,0 +1,285 @@
+#!/usr/bin/env python
+import json
+import os
+import sys
+import unittest
+from contextlib import contextmanager
+from unittest import mock
+from urllib.parse import urlparse
+
+# make the in-tree fblib importable when the suite is run directly
+# ('python tests/tests.py'); pytest gets the same insert from conftest.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fblib.core import GraphAPI, AppAPI, UserAPI, FacebookError
+
+try:  # optional: record live Graph responses once, replay them afterwards
+    import vcr
+    _cassette = vcr.VCR(
+        cassette_library_dir=os.path.join(os.path.dirname(__file__),
+                                          'cassettes'),
+        filter_headers=['Authorization'],
+        filter_query_parameters=['access_token'],
+        decode_compressed_response=True,
+        record_mode='once').use_cassette
+except ImportError:
+    def _cassette(path):  # vcrpy not installed: run the live tests as-is
+        def decorator(fn):
+            return fn
+        return decorator
+
+app_id = os.environ.get('FB_APP_ID', None)
+app_secret = os.environ.get('FB_APP_SECRET', None)
+access_token = os.environ.get('FB_ACCESS_TOKEN', None)
+
+_APP_TOKEN = {'access_token': 'app|token', 'expires_in': 5183999}
+
+#: key sets asserted as a whole: one subset check instead of a chain of
+#: assertIn calls
+_ERROR_KEYS = frozenset(('message', 'type', 'code'))
+_CREATE_USER_KEYS = frozenset(('access_token', 'password', 'login_url',
+                               'id', 'email'))
+
+_TEST_USER = {
+    'id': '100001',
+    'email': 'serg_ivanov@tfbnw.net',
+    'access_token': 'test-user-token',
+    'password': 'hunter2',
+    'login_url': 'https://developers.facebook.com/checkpoint/100001/'
+}
+
+
+def _response(payload, status_code=200):
+    """ Build a minimal stand-in for `requests.Response`;
+        `GraphAPI._request` only touches content, status_code and reason.
+    """
+    res = mock.Mock()
+    res.content = json.dumps(payload).encode()
+    res.status_code = status_code
+    res.reason = 'OK' if status_code < 400 else 'Bad Request'
+    return res
+
+
+@contextmanager
+def _graph_session(*payloads):
+    """ Replace the shared Graph session with a transport that answers
+        each successive request with the next canned payload, so tests
+        never touch graph.facebook.com. Yields the mock session for
+        asserting on the issued requests.
+    """
+    session = mock.Mock()
+    session.request.side_effect = [
+        payload if isinstance(payload, mock.Mock) else _response(payload)
+        for payload in payloads]
+    with mock.patch.object(GraphAPI, 'session', session):
+        yield session
+
+
+class TestFacebookError(unittest.TestCase):
+
+    def test_error_messages(self):
+        error_body = {'error': {'message': 'Invalid OAuth access token.',
+                                'type': 'OAuthException',
+                                'code': 190}}
+        with _graph_session(_response(error_body, status_code=400)):
+            api = UserAPI('Wrong')
+            with self.assertRaises(FacebookError) as fe:
+                api.get_objects('me')
+        error = fe.exception.value['error']
+        self.assertGreaterEqual(error.keys(), _ERROR_KEYS)
+        self.assertEqual(error['code'], 190)
+        self.assertEqual(error['type'], 'OAuthException')
+
+
+class TestAppAPI(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # one AppAPI — and one token fetch — shared by every test method;
+        # token_cache=None keeps the on-disk token cache out of the tests
+        cls.api = AppAPI(app_id or '123', app_secret or 'secret',
+                         token_cache=None)
+        with _graph_session(_APP_TOKEN) as session:
+            cls.app_token = cls.api.get_app_access_token()
+            cls.token_url = session.request.call_args_list[0][0][1]
+
+    def test_token_fetch(self):
+        self.assertEqual(self.app_token, _APP_TOKEN['access_token'])
+        self.assertIn('oauth/access_token', self.token_url)
+
+    def test_token_memoized(self):
+        # the token fetched in setUpClass is reused without a round-trip
+        with _graph_session() as session:
+            self.assertEqual(self.api.get_app_access_token(),
+                             self.app_token)
+        self.assertFalse(session.request.called)
+
+    def test_list_test_users(self):
+        with _graph_session({'data': [_TEST_USER]}):
+            res = self.api.get_list_of_test_users()
+        self.assertIn('data', res)
+        self.assertEqual(len(res['data']), 1)
+
+    def test_create_and_delete_test_user(self):
+        with _graph_session({'data': []},
+                            _TEST_USER,
+                            {'data': [_TEST_USER]},
+                            {'success': True},
+                            {'data': []}) as session:
+
+            # get list of test users assigned to the application
+            res = self.api.get_list_of_test_users()
+            test_users = len(res['data'])
+
+            # create test user
+            res = self.api.create_test_user(name='Serg Ivanov')
+            self.assertGreaterEqual(res.keys(), _CREATE_USER_KEYS)
+
+            # structural URL check: cheaper and stricter than a regex
+            parsed = urlparse(res['login_url'])
+            self.assertIn(parsed.scheme, ('http', 'https'))
+            self.assertTrue(parsed.netloc)
+
+            res2 = self.api.get_list_of_test_users()
+            self.assertEqual(test_users + 1, len(res2['data']))
+
+            # delete test user
+            user_api = UserAPI(res['access_token'])
+            user_api.delete('me')
+
+            res = self.api.get_list_of_test_users()
+            self.assertEqual(test_users, len(res['data']))
+
+        self.assertEqual(session.request.call_count, 5)
+
+
+class TestUserAPI(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # one UserAPI shared by every test method
+        cls.api = UserAPI(access_token or 'user-token')
+
+    def test_get_me(self):
+        with _graph_session({'name': 'Serg Ivanov', 'id': '100001'}):
+            res = self.api.get_objects('me')
+        self.assertGreaterEqual(res.keys(), {'name', 'id'})
+
+    def test_get_fields(self):
+        with _graph_session({'first_name': 'Serg', 'id': '100001'}):
+            res = self.api.get_objects('me', fields='first_name')
+        self.assertIn('first_name', res)
+
+    def test_get_friends(self):
+        with _graph_session({'data': []}):
+            res = self.api.get_connections('me', 'friends', limit=10)
+        self.assertIn('data', res)
+        self.assertEqual(res['data'], [])
+
+    def test_batch(self):
+        # two queued calls travel as one Graph batch round-trip
+        batch_response = [
+            {'code': 200,
+             'body': json.dumps({'name': 'Serg Ivanov', 'id': '100001'})},
+            {'code': 200,
+             'body': json.dumps({'data': []})}
+        ]
+        with _graph_session(batch_response) as session:
+            with self.api.batching() as queue:
+                me = queue.get_objects('me')
+                friends = queue.get_connections('me', 'friends', limit=10)
+        self.assertEqual(me.result()['id'], '100001')
+        self.assertEqual(friends.result()['data'], [])
+        self.assertEqual(session.request.call_count, 1)
+
+    def test_publish_and_delete(self):
+        with _graph_session({'id': 'post1'},
+                            {'success': True}):
+            # Publish post
+            res = self.api.publish('me', 'feed',
+                                   message='I like this new API!')
+            self.assertIn('id', res)
+            post_id = res['id']
+            # Delete post
+            self.api.delete(post_id)
+
+
+@unittest.skipUnless(access_token, 'FB_ACCESS_TOKEN not set')
+class TestLiveUserAPI(unittest.TestCase):
+    """ Functional tests against the real Graph API; need FB_ACCESS_TOKEN.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        # one client per class: the pooled session keeps the TLS
+        # connection to graph.facebook.com warm across test methods
+        cls.api = UserAPI(access_token)
+
+    @_cassette('TestLiveUserAPI.test_default_workflow.yaml')
+    def test_default_workflow(self):
+
+        # get information about user
+        res = self.api.get_objects('me')
+        self.assertGreaterEqual(res.keys(), {'name', 'id'})
+
+        # get information about user education and first_name
+        res = self.api.get_objects('me', fields='first_name')
+        self.assertIn('first_name', res)
+
+        # get 10 friends
+        res = self.api.get_connections('me', 'friends', limit=10)
+        self.assertIn('data', res)
+
+        # Get next 10 friends
+        if 'paging' in res and 'next' in res['paging']:
+            res = self.api.get_connections('me', 'friends', limit=10,
+                offset=10)
+            self.assertIn('paging', res)
+            self.assertIn('data', res)
+            self.assertEqual(len(res['data']), 10)
+
+
+@unittest.skipUnless(app_id and app_secret,
+                     'FB_APP_ID/FB_APP_SECRET not set')
+class TestLiveAppAPI(unittest.TestCase):
+    """ Functional tests against the real Graph API; need FB_APP_ID and
+        FB_APP_SECRET.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        # one client per class: the pooled session keeps the TLS
+        # connection to graph.facebook.com warm across test methods
+        cls.api = AppAPI(app_id, app_secret)
+
+    @_cassette('TestLiveAppAPI.test_default_workflow.yaml')
+    def test_default_workflow(self):
+
+        # get app access token
+        res = self.api.get_app_access_token()
+        self.assertTrue(res)
+
+        # get list of test users assigned to the application
+        res = self.api.get_list_of_test_users()
+        self.assertIn('data', res)
+        test_users = len(res['data'])
+
+        # create test user
+        res = self.api.create_test_user(name='Serg Ivanov')
+        self.assertIn('access_token', res)
+
+        res2 = self.api.get_list_of_test_users()
+        self.assertEqual(test_users + 1, len(res2['data']))
+
+        # delete test user
+        user_api = UserAPI(res['access_token'])
+        user_api.delete('me')
+
+        res = self.api.get_list_of_test_users()
+        self.assertEqual(test_users, len(res['data']))
+
+
+if __name__ == '__main__':
+    # buffer=True keeps per-test stdout/stderr in memory and only shows
+    # it on failure; verbosity=0 skips the per-test dot formatting
+    unittest.main(verbosity=0, buffer=True)